@@ -56,18 +56,30 @@ from .orchestrator import ValidationOrchestrator
 # Reporting
 from .reporter import ValidationReporter
 
-# Execution
-from .runner import TestRunner
-from .static_analyzer import StaticAnalyzer
-from .linter import Linter
-from .syntax_checker import SyntaxChecker
+# Execution and dependency validation are imported on first access, so
+# importing the package (or the orchestrator) doesn't load every tool runner
+_LAZY_IMPORTS = {
+    # Execution
+    "TestRunner": ".runner",
+    "StaticAnalyzer": ".static_analyzer",
+    "Linter": ".linter",
+    "SyntaxChecker": ".syntax_checker",
+    # Dependency validation
+    "DependencyValidator": ".dependency_validator",
+    "DependencyResult": ".dependency_validator",
+    "DependencyIssue": ".dependency_validator",
+}
 
-# Dependency validation
-from .dependency_validator import (
-    DependencyValidator,
-    DependencyResult,
-    DependencyIssue
-)
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
 
 __all__ = [
     # Detection
@@ -5,13 +5,202 @@ Detects available testing frameworks and validation tools in a repository.
 """
 
 import os
-import subprocess
-from typing import List, Optional, Set, Dict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, reduce
+from itertools import islice
+from typing import List, Optional, Set, Dict, Iterator, Tuple, FrozenSet, Final
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
 
+# Directory names excluded from repository scans (matched per path component)
+_IGNORE_DIRS: Final = frozenset({
+    ".git", "node_modules", "__pycache__", ".venv", "venv",
+    "dist", "build", "target", ".pytest_cache"
+})
+
+# Directory name suffixes excluded from repository scans
+_IGNORE_SUFFIXES: Final = (".egg-info",)
+
+# File extension to language mapping used for primary language detection
+_EXT_TO_LANG: Final = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
+    ".rb": "ruby",
+}
+
+
+def walk_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Walk a directory tree with os.scandir, yielding file entries.
+
+    Ignored directories (VCS metadata, dependencies, build output) are pruned
+    as soon as they are seen rather than filtered per file.
+
+    Args:
+        root: Directory to walk
+    """
+    ignore_dirs = _IGNORE_DIRS
+    ignore_suffixes = _IGNORE_SUFFIXES
+    stack = [root]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        name = entry.name
+                        if name not in ignore_dirs and not name.endswith(ignore_suffixes):
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _compile_test_patterns(
+    patterns: Tuple[str, ...]
+) -> Tuple[FrozenSet[str], Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """
+    Split test file globs into exact names, suffixes and (prefix, suffix) pairs.
+
+    ``*_test.go`` becomes the suffix ``_test.go`` (all suffixes of a language
+    are checked with one ``str.endswith`` call), ``test_*.py`` becomes
+    ``("test_", ".py")`` and literals such as ``tests.py`` are matched exactly.
+    """
+    exact = set()
+    suffixes = []
+    affixes = []
+
+    for pattern in patterns:
+        if "*" not in pattern:
+            exact.add(pattern)
+            continue
+
+        prefix, _, suffix = pattern.partition("*")
+        if prefix:
+            affixes.append((prefix, suffix))
+        else:
+            suffixes.append(suffix)
+
+    return frozenset(exact), tuple(suffixes), tuple(affixes)
+
+
+def _invert_framework_configs(
+    framework_configs: Dict[str, Tuple[str, ...]]
+) -> Dict[str, Tuple[str, ...]]:
+    """
+    Invert framework -> config files into config file -> frameworks.
+
+    Keys keep first-seen order, which is the priority order config files are
+    probed in during framework detection.
+    """
+    inverted: Dict[str, List[str]] = {}
+    for framework, config_files in framework_configs.items():
+        for config_file in config_files:
+            inverted.setdefault(config_file, []).append(framework)
+
+    return {config_file: tuple(frameworks) for config_file, frameworks in inverted.items()}
+
+
+# Test directory patterns by language
+TEST_DIRECTORIES: Final[Dict[str, Tuple[str, ...]]] = {
+    "python": ("tests", "test", "__tests__", "testing"),
+    "javascript": ("test", "tests", "__tests__", "spec", "__test__"),
+    "typescript": ("test", "tests", "__tests__", "spec"),
+    "go": ("_test",),
+    "rust": ("tests",),
+    "java": ("test", "tests", "src/test"),
+    "ruby": ("test", "spec"),
+}
+
+# Test directories checked regardless of language
+_COMMON_TEST_DIRECTORIES: Final = ("tests", "test", "__tests__")
+
+# Test file patterns by language
+TEST_FILE_PATTERNS: Final[Dict[str, Tuple[str, ...]]] = {
+    "python": ("test_*.py", "*_test.py", "tests.py"),
+    "javascript": ("*.test.js", "*.spec.js", "*Test.js", "*_test.js"),
+    "typescript": ("*.test.ts", "*.spec.ts", "*.test.tsx", "*.spec.tsx"),
+    "go": ("*_test.go",),
+    "rust": ("tests.rs", "test_*.rs"),
+    "java": ("*Test.java", "*Tests.java"),
+    "ruby": ("*_spec.rb", "*_test.rb"),
+}
+
+# Framework config files
+FRAMEWORK_CONFIGS: Final[Dict[str, Tuple[str, ...]]] = {
+    "pytest": ("pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini"),
+    "unittest": ("setup.py",),
+    "jest": ("jest.config.js", "jest.config.ts", "jest.config.json", "package.json"),
+    "mocha": (".mocharc.json", ".mocharc.js", "package.json"),
+    "vitest": ("vitest.config.ts", "vitest.config.js"),
+    "go_test": ("go.mod",),
+    "cargo_test": ("Cargo.toml",),
+    "rspec": (".rspec", "spec/spec_helper.rb"),
+}
+
+# TEST_FILE_PATTERNS precompiled into name checks (no fnmatch per file)
+_TEST_FILE_MATCHERS: Final = {
+    lang: _compile_test_patterns(patterns)
+    for lang, patterns in TEST_FILE_PATTERNS.items()
+}
+
+# FRAMEWORK_CONFIGS inverted to config file -> frameworks, in probe order
+_CONFIG_TO_FRAMEWORKS: Final = _invert_framework_configs(FRAMEWORK_CONFIGS)
+
+
+@lru_cache(maxsize=1)
+def _path_executables() -> Tuple[FrozenSet[str], ...]:
+    """
+    List the file names in every directory on PATH, once per process.
+
+    Resolving tools against these sets replaces one PATH search (or one
+    ``tool --version`` subprocess) per tool with a single scan of PATH.
+    """
+    directories = []
+
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                names = frozenset(
+                    entry.name.lower() if os.name == "nt" else entry.name
+                    for entry in entries
+                    if entry.is_file()
+                )
+        except OSError:
+            continue
+        directories.append(names)
+
+    return tuple(directories)
+
+
+def is_on_path(tool_name: str) -> bool:
+    """Check if an executable named tool_name exists in any PATH directory"""
+    if os.name == "nt":
+        tool_name = tool_name.lower()
+        pathext = os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").lower().split(os.pathsep)
+        candidates = (tool_name, *(tool_name + ext for ext in pathext))
+    else:
+        candidates = (tool_name,)
+
+    return any(
+        candidate in names
+        for names in _path_executables()
+        for candidate in candidates
+    )
+
+
 class ValidationTier(Enum):
     """Available validation tiers in order of preference"""
     TESTS = "tests"
@@ -39,48 +228,25 @@ class TestFrameworkDetector:
     Detects test frameworks across multiple languages.
     """
 
-    # Test directory patterns by language
-    TEST_DIRECTORIES = {
-        "python": ["tests", "test", "__tests__", "testing"],
-        "javascript": ["test", "tests", "__tests__", "spec", "__test__"],
-        "typescript": ["test", "tests", "__tests__", "spec"],
-        "go": ["_test"],
-        "rust": ["tests"],
-        "java": ["test", "tests", "src/test"],
-        "ruby": ["test", "spec"],
-    }
-
-    # Test file patterns by language
-    TEST_FILE_PATTERNS = {
-        "python": ["test_*.py", "*_test.py", "tests.py"],
-        "javascript": ["*.test.js", "*.spec.js", "*Test.js", "*_test.js"],
-        "typescript": ["*.test.ts", "*.spec.ts", "*.test.tsx", "*.spec.tsx"],
-        "go": ["*_test.go"],
-        "rust": ["tests.rs", "test_*.rs"],
-        "java": ["*Test.java", "*Tests.java"],
-        "ruby": ["*_spec.rb", "*_test.rb"],
-    }
-
-    # Framework config files
-    FRAMEWORK_CONFIGS = {
-        "pytest": ["pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini"],
-        "unittest": ["setup.py"],
-        "jest": ["jest.config.js", "jest.config.ts", "jest.config.json", "package.json"],
-        "mocha": [".mocharc.json", ".mocharc.js", "package.json"],
-        "vitest": ["vitest.config.ts", "vitest.config.js"],
-        "go_test": ["go.mod"],
-        "cargo_test": ["Cargo.toml"],
-        "rspec": [".rspec", "spec/spec_helper.rb"],
-    }
-
-    def __init__(self, repo_path: str):
+    # Kept as class attributes for callers that read them off the detector
+    TEST_DIRECTORIES = TEST_DIRECTORIES
+    TEST_FILE_PATTERNS = TEST_FILE_PATTERNS
+    FRAMEWORK_CONFIGS = FRAMEWORK_CONFIGS
+
+    def __init__(self, repo_path: str, max_files: int = 2000):
         """
         Initialize detector.
 
         Args:
             repo_path: Path to repository root
+            max_files: Number of source files sampled for language detection
         """
         self.repo_path = Path(repo_path)
+        self.max_files = max_files
+        # Walked paths all start with this prefix, so slicing yields relative paths
+        self._repo_str = str(self.repo_path)
+        self._repo_prefix_len = len(os.path.join(self._repo_str, ""))
+        self._root_entries: Optional[FrozenSet[str]] = None
 
     def detect(self) -> TestDetectionResult:
         """
@@ -128,72 +294,152 @@ class TestFrameworkDetector:
         )
 
     def _detect_language(self) -> Optional[str]:
-        """Detect primary programming language"""
-        # Count files by extension
-        extensions = {}
+        """
+        Detect primary programming language.
 
-        for file_path in self.repo_path.rglob("*"):
-            if file_path.is_file() and not self._should_ignore_path(file_path):
-                ext = file_path.suffix.lower()
-                extensions[ext] = extensions.get(ext, 0) + 1
+        At most ``max_files`` source files are counted in total. Top-level
+        directories are walked concurrently, each drawing an even share of
+        what is left of that budget; a directory that runs out of files
+        leaves its unused share to the others in the next round.
+        """
+        root_files = []
+        subdirs = []
 
-        if not extensions:
+        try:
+            with os.scandir(self._repo_str) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        name = entry.name
+                        if name not in _IGNORE_DIRS and not name.endswith(_IGNORE_SUFFIXES):
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        root_files.append(entry)
+        except OSError:
             return None
 
-        # Map extensions to languages
-        ext_to_lang = {
-            ".py": "python",
-            ".js": "javascript",
-            ".jsx": "javascript",
-            ".ts": "typescript",
-            ".tsx": "typescript",
-            ".go": "go",
-            ".rs": "rust",
-            ".java": "java",
-            ".rb": "ruby",
-        }
+        # Count source files by extension
+        extensions = Counter()
+        budget = self.max_files - self._count_extensions(iter(root_files), extensions, self.max_files)
+
+        # One paused walk and Counter per top-level directory
+        walks = [(self._iter_files(d), Counter()) for d in subdirs]
+        active = walks
+
+        # os.scandir releases the GIL, so subtree walks overlap on I/O; not
+        # worth spinning up threads for a couple of directories
+        executor = ThreadPoolExecutor(max_workers=min(8, len(subdirs))) if len(subdirs) > 2 else None
+        map_walks = executor.map if executor else map
+        try:
+            while active and budget > 0:
+                active = active[:budget]  # At least one file per walk
+                share = budget // len(active)
+                counted = list(map_walks(
+                    lambda walk: self._count_extensions(walk[0], walk[1], share),
+                    active
+                ))
+                budget -= sum(counted)
+                # Walks that fell short of their share have no files left
+                active = [walk for walk, n in zip(active, counted) if n == share]
+        finally:
+            if executor:
+                executor.shutdown()
+
+        extensions = reduce(Counter.__add__, (counts for _, counts in walks), extensions)
+
+        if not extensions:
+            return None
 
         # Find most common language
         max_count = 0
         primary_lang = None
 
         for ext, count in extensions.items():
-            if ext in ext_to_lang and count > max_count:
+            if count > max_count:
                 max_count = count
-                primary_lang = ext_to_lang[ext]
+                primary_lang = _EXT_TO_LANG[ext]
 
         return primary_lang
 
+    def _count_extensions(
+        self,
+        entries: Iterator[os.DirEntry],
+        extensions: Counter,
+        limit: int
+    ) -> int:
+        """
+        Count recognised source file extensions, stopping after limit files.
+
+        Args:
+            entries: File entries; left positioned after the last one counted
+            extensions: Counter updated in place
+            limit: Most files to count
+
+        Returns:
+            Number of files counted (below limit only once entries ran out)
+        """
+        ext_to_lang = _EXT_TO_LANG
+        sampled = 0
+
+        if limit <= 0:
+            return 0
+
+        for entry in entries:
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext not in ext_to_lang:
+                continue
+
+            extensions[ext] += 1
+            sampled += 1
+            if sampled >= limit:
+                break
+
+        return sampled
+
     def _find_test_directories(self, language: Optional[str]) -> List[str]:
         """Find test directories"""
         test_dirs = []
 
-        # Get patterns for language
-        patterns = self.TEST_DIRECTORIES.get(language, []) if language else []
-        # Also check common patterns
-        patterns.extend(["tests", "test", "__tests__"])
-        patterns = list(set(patterns))  # Remove duplicates
+        # Get patterns for language, plus common patterns (de-duplicated, in order)
+        patterns = TEST_DIRECTORIES.get(language, ()) if language else ()
+        patterns = dict.fromkeys(patterns + _COMMON_TEST_DIRECTORIES)
 
         for pattern in patterns:
             dir_path = self.repo_path / pattern
-            if dir_path.exists() and dir_path.is_dir():
-                test_dirs.append(str(dir_path.relative_to(self.repo_path)))
+            if dir_path.is_dir():
+                test_dirs.append(pattern)
 
         return test_dirs
 
     def _find_test_files(self, language: Optional[str]) -> List[str]:
         """Find test files"""
-        test_files = []
-
         # Get patterns for language
-        patterns = self.TEST_FILE_PATTERNS.get(language, []) if language else []
+        matcher = _TEST_FILE_MATCHERS.get(language) if language else None
+        if matcher is None:
+            return []
 
-        for pattern in patterns:
-            for file_path in self.repo_path.rglob(pattern):
-                if file_path.is_file() and not self._should_ignore_path(file_path):
-                    test_files.append(str(file_path.relative_to(self.repo_path)))
+        # Limit to first 100; islice stops the walk as soon as the cap is hit
+        prefix_len = self._repo_prefix_len
+        return [
+            entry.path[prefix_len:]
+            for entry in islice(self._iter_test_files(matcher), 100)
+        ]
 
-        return test_files[:100]  # Limit to first 100
+    def _iter_test_files(
+        self,
+        matcher: Tuple[FrozenSet[str], Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+    ) -> Iterator[os.DirEntry]:
+        """Yield files whose names match the compiled test patterns"""
+        exact, suffixes, affixes = matcher
+
+        for entry in self._iter_files():
+            name = entry.name
+            if name in exact or name.endswith(suffixes) or any(
+                len(name) >= len(prefix) + len(suffix)
+                and name.startswith(prefix)
+                and name.endswith(suffix)
+                for prefix, suffix in affixes
+            ):
+                yield entry
 
     def _detect_framework(
         self,
@@ -203,12 +449,14 @@ class TestFrameworkDetector:
     ) -> Optional[str]:
         """Detect test framework from config files or conventions"""
         # Check for framework-specific config files
-        for framework, config_files in self.FRAMEWORK_CONFIGS.items():
-            for config_file in config_files:
-                if (self.repo_path / config_file).exists():
-                    # Verify it's the right framework
-                    if self._verify_framework_config(framework, config_file):
-                        return framework
+        has_root_file = self._has_root_file
+        for config_file, frameworks in _CONFIG_TO_FRAMEWORKS.items():
+            if not has_root_file(config_file):
+                continue
+            for framework in frameworks:
+                # Verify it's the right framework
+                if self._verify_framework_config(framework, config_file):
+                    return framework
 
         # Infer from language and test files
         if language == "python":
@@ -295,21 +543,33 @@ class TestFrameworkDetector:
             return []
 
         config_files = []
-        for config_file in self.FRAMEWORK_CONFIGS.get(framework, []):
-            if (self.repo_path / config_file).exists():
+        for config_file in FRAMEWORK_CONFIGS.get(framework, ()):
+            if self._has_root_file(config_file):
                 config_files.append(config_file)
 
         return config_files
 
-    def _should_ignore_path(self, path: Path) -> bool:
-        """Check if path should be ignored"""
-        ignore_patterns = [
-            ".git", "node_modules", "__pycache__", ".venv", "venv",
-            "dist", "build", ".egg-info", "target", ".pytest_cache"
-        ]
+    def _has_root_file(self, relative_path: str) -> bool:
+        """Check if a config file exists, using one cached listing of the repo root"""
+        if "/" in relative_path:
+            return (self.repo_path / relative_path).exists()
+
+        if self._root_entries is None:
+            try:
+                self._root_entries = frozenset(os.listdir(self.repo_path))
+            except OSError:
+                self._root_entries = frozenset()
+
+        return relative_path in self._root_entries
+
+    def _iter_files(self, root: Optional[str] = None) -> Iterator[os.DirEntry]:
+        """
+        Walk the repository, pruning ignored directories as they are found.
 
-        path_str = str(path)
-        return any(pattern in path_str for pattern in ignore_patterns)
+        Args:
+            root: Directory to walk (defaults to the repository root)
+        """
+        return walk_files(root or self._repo_str)
 
 
 class ValidationTierDetector:
@@ -395,12 +655,4 @@ class ValidationTierDetector:
 
     def _is_tool_available(self, tool_name: str) -> bool:
         """Check if a tool is available in PATH"""
-        try:
-            subprocess.run(
-                [tool_name, "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        return is_on_path(tool_name)
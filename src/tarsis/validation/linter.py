@@ -4,14 +4,76 @@ Linter for code quality checks.
 Supports pylint, flake8, eslint, rubocop, and other linting tools.
 """
 
-import subprocess
+import asyncio
+import hashlib
+import os
 import re
-import json
+import subprocess
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set, Tuple
 
+from .detector import is_on_path, walk_files
 from .result_types import LintResult, LintIssue, ValidationStatus
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    """Decode a JSON report; orjson is several times faster on large reports."""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    # Only paid by sessions that actually parse JSON without orjson
+    import json
+    return json.loads(data)
+
+
+# Severity name indexed by "is error" (False -> warning, True -> error)
+_SEVERITY_NAMES = ("warning", "error")
+
+# Leading whitespace then "[" or "{"; only the start of the output is examined
+_JSON_START_RE = re.compile(rb'\s*[\[{]')
+
+# Line-scan patterns work on raw subprocess bytes; only captured groups are decoded
+# Pylint format: file:line:col: C0111: message (code)
+_PYLINT_RE = re.compile(rb'([^:]+):(\d+):(\d+):\s*([A-Z]\d+):\s*(.+?)\s*\(([^\)]+)\)')
+
+# Flake8 format: file:line:col: code message
+_FLAKE8_RE = re.compile(rb'([^:]+):(\d+):(\d+):\s*([A-Z]\d+)\s+(.+)')
+
+# ESLint / Rubocop text summaries: "3 errors", "2 warnings", "5 offenses"
+_ESLINT_ERROR_RE = re.compile(r'(\d+)\s+error')
+_ESLINT_WARNING_RE = re.compile(r'(\d+)\s+warning')
+_RUBOCOP_OFFENSE_RE = re.compile(r'(\d+)\s+offense')
+
+# Generic error/warning mentions for unknown linters; group 1 = error, group 2 = warning
+_GENERIC_SEVERITY_RE = re.compile(r'\b(?:(error)|(warning))\b', re.IGNORECASE)
+
+
+def _decode(data: bytes) -> str:
+    """Decode subprocess output, replacing invalid UTF-8 sequences."""
+    return data.decode("utf-8", errors="replace")
+
+
+def _combined_output(stdout: bytes, stderr: bytes) -> str:
+    """Decoded stdout and stderr joined the way LintResult.output stores them."""
+    return _decode(stdout) + "\n" + _decode(stderr)
+
+
+@lru_cache(maxsize=32)
+def _tool_version(tool_name: str) -> str:
+    """Version banner of a tool, run once per process (empty if it can't be run)"""
+    try:
+        result = subprocess.run([tool_name, "--version"], capture_output=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return _decode(result.stdout + result.stderr)
+
 
 class Linter:
     """
@@ -70,19 +132,45 @@ class Linter:
         ],
     }
 
-    def __init__(self, repo_path: str):
+    # Linters that accept an explicit file list (and so can be cached per file)
+    FILE_LIST_LINTERS = ("pylint", "flake8")
+
+    # File lists longer than this are split across parallel linter processes
+    FILE_CHUNK_SIZE = 200
+
+    # Source file extensions linted when no explicit file list is given
+    LANGUAGE_EXTENSIONS = {
+        "python": (".py",),
+        "javascript": (".js", ".jsx"),
+        "typescript": (".ts", ".tsx"),
+        "ruby": (".rb",),
+        "rust": (".rs",),
+    }
+
+    def __init__(self, repo_path: str, cache_dir: Optional[str] = ".tarsis/lint-cache"):
         """
         Initialize linter.
 
         Args:
             repo_path: Path to repository root
+            cache_dir: Directory for per-file lint result caches (None disables caching)
         """
         self.repo_path = Path(repo_path)
 
+        # One cache directory per repository, so relative paths never collide
+        self.cache_dir = None
+        if cache_dir:
+            repo_key = hashlib.blake2b(
+                str(self.repo_path.resolve()).encode(),
+                digest_size=8
+            ).hexdigest()
+            self.cache_dir = Path(cache_dir).resolve() / repo_key
+
     async def run_linting(
         self,
         language: str,
-        files: Optional[List[str]] = None
+        files: Optional[List[str]] = None,
+        parse_issues: bool = True
     ) -> LintResult:
         """
         Run linting for given language.
@@ -90,6 +178,9 @@ class Linter:
         Args:
             language: Programming language
             files: Optional list of files to lint
+            parse_issues: Build per-issue LintIssue objects. Pass False for
+                pass/fail gates that only need the error/warning counts;
+                text-output parsers then skip issue construction.
 
         Returns:
             LintResult with linting outcomes
@@ -104,113 +195,441 @@ class Linter:
                 output=f"No linter available for {language}"
             )
 
-        # Try each linter until one works
-        for linter_config in linters:
-            tool_name = linter_config["name"]
+        # Launch every available linter at once. Results are taken in priority
+        # order, so the outcome matches trying them one at a time, and the
+        # rest are cancelled as soon as one answers.
+        available_tools = self._probe_all(linters)
+        available = [
+            linter_config for linter_config in linters
+            if linter_config["name"] in available_tools
+        ]
+
+        # Without an explicit file list, lint the source files individually so
+        # files unchanged since the last run are answered from the cache
+        if files is None and self.cache_dir and any(
+            linter_config["name"] in self.FILE_LIST_LINTERS for linter_config in available
+        ):
+            # A full-repository walk: keep it off the event loop
+            loop = asyncio.get_running_loop()
+            files = await loop.run_in_executor(None, self._find_source_files, language) or None
+
+        tasks = [
+            asyncio.create_task(self._run_linter(linter_config, files, parse_issues))
+            for linter_config in available
+        ]
+        try:
+            for task in tasks:
+                lint_result = await task
+                if lint_result is not None:
+                    return lint_result
+        finally:
+            # Stop lower-priority linters that are still running
+            for task in tasks:
+                task.cancel()
 
-            # Check if tool is available
-            if not self._is_tool_available(tool_name):
-                continue
+        # No linter worked
+        return LintResult(
+            status=ValidationStatus.SKIPPED,
+            tool="none",
+            output=f"No working linter found for {language}"
+        )
 
-            # Run the linter
-            try:
-                command = linter_config["command"].copy()
-
-                # Add files if specified
-                if files:
-                    # Replace "." with specific files for some linters
-                    if "." in command and tool_name in ("pylint", "flake8"):
-                        command.remove(".")
-                        command.extend(files)
-
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    timeout=180,  # 3 minute timeout
-                    cwd=str(self.repo_path)
-                )
+    async def _run_linter(
+        self,
+        linter_config: Dict,
+        files: Optional[List[str]] = None,
+        parse_issues: bool = True
+    ) -> Optional[LintResult]:
+        """
+        Run a single linter, reusing cached issues for unchanged files.
 
-                # Parse output
-                lint_result = self._parse_linter_output(
-                    tool_name,
-                    result.stdout,
-                    result.stderr,
-                    result.returncode,
-                    linter_config.get("supports_json", False)
-                )
+        Args:
+            linter_config: Entry from LINTERS
+            files: Optional list of files to lint
+            parse_issues: Whether to build LintIssue objects (the cache needs them)
 
+        Returns:
+            LintResult, or None if the tool could not be started
+        """
+        tool_name = linter_config["name"]
+
+        if (
+            not files
+            or not parse_issues
+            or not self.cache_dir
+            or tool_name not in self.FILE_LIST_LINTERS
+        ):
+            return await self._execute_linter(linter_config, files, parse_issues)
+
+        # Stats, hashes and cache file I/O scale with the repository, so they
+        # run in the executor rather than on the event loop
+        loop = asyncio.get_running_loop()
+        cache_header, cache, cached_issues, misses, signatures, refreshed = (
+            await loop.run_in_executor(None, self._partition_files, linter_config, files)
+        )
+
+        if misses:
+            lint_result = await self._execute_linter(linter_config, misses)
+            if lint_result is None or lint_result.status not in (
+                ValidationStatus.PASSED, ValidationStatus.FAILED
+            ):
                 return lint_result
 
-            except subprocess.TimeoutExpired:
+            await loop.run_in_executor(
+                None, self._update_cache,
+                tool_name, cache_header, cache, signatures, lint_result.issues
+            )
+        else:
+            if refreshed:
+                await loop.run_in_executor(
+                    None, self._save_cache, tool_name, cache_header, cache
+                )
+            lint_result = LintResult(
+                status=ValidationStatus.PASSED,
+                tool=tool_name,
+                output=f"All {len(files)} file(s) unchanged since last lint (cached)"
+            )
+
+        return self._merge_cached_issues(lint_result, cached_issues)
+
+    async def _execute_linter(
+        self,
+        linter_config: Dict,
+        files: Optional[List[str]] = None,
+        parse_issues: bool = True
+    ) -> Optional[LintResult]:
+        """
+        Execute a linter subprocess and parse its output.
+
+        Args:
+            linter_config: Entry from LINTERS
+            files: Optional list of files to lint
+            parse_issues: Whether to build LintIssue objects
+
+        Returns:
+            LintResult, or None if the tool could not be started
+        """
+        tool_name = linter_config["name"]
+
+        if files and tool_name in self.FILE_LIST_LINTERS and len(files) > self.FILE_CHUNK_SIZE:
+            return await self._execute_chunked(linter_config, files, parse_issues)
+
+        try:
+            command = linter_config["command"].copy()
+
+            # Add files if specified
+            if files:
+                # Replace "." with specific files for some linters
+                if "." in command and tool_name in ("pylint", "flake8"):
+                    command.remove(".")
+                    command.extend(files)
+
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.repo_path)
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=180  # 3 minute timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
                 return LintResult(
                     status=ValidationStatus.ERROR,
                     tool=tool_name,
                     error_message="Linting timed out (3 minutes)"
                 )
-            except FileNotFoundError:
-                # Tool not found, try next
+            except asyncio.CancelledError:
+                # Superseded (e.g. a higher-priority validation tier finished first)
+                process.kill()
+                # Reap the child so it doesn't linger holding its pipes, even if
+                # this task is cancelled again while waiting
+                await asyncio.shield(process.wait())
+                raise
+
+            # Parse output
+            return self._parse_linter_output(
+                tool_name,
+                stdout,
+                stderr,
+                process.returncode,
+                linter_config.get("supports_json", False),
+                parse_issues
+            )
+
+        except FileNotFoundError:
+            # Tool not found, let the next linter answer
+            return None
+        except Exception as e:
+            return LintResult(
+                status=ValidationStatus.ERROR,
+                tool=tool_name,
+                error_message=f"Failed to run {tool_name}: {str(e)}"
+            )
+
+    def _partition_files(self, linter_config: Dict, files: List[str]) -> Tuple:
+        """
+        Split files into those answered by the lint cache and those to lint.
+
+        Args:
+            linter_config: Entry from LINTERS
+            files: Files to lint
+
+        Returns:
+            (cache header, cache, cached issues, files to lint,
+            signatures of files to lint, whether cache entries were refreshed)
+        """
+        tool_name = linter_config["name"]
+
+        # Cached issues are only valid for the same tool version and config
+        cache_header = self._cache_header(linter_config)
+        cache = self._load_cache(tool_name, cache_header)
+        signatures: Dict[str, Dict] = {}
+        cached_issues = []
+        misses = []
+        refreshed = False
+
+        for file_path in files:
+            entry = cache.get(os.path.normpath(file_path))
+            try:
+                stat = os.stat(self.repo_path / file_path)
+            except OSError:
+                misses.append(file_path)
                 continue
-            except Exception as e:
-                return LintResult(
-                    status=ValidationStatus.ERROR,
-                    tool=tool_name,
-                    error_message=f"Failed to run {tool_name}: {str(e)}"
-                )
 
-        # No linter worked
-        return LintResult(
-            status=ValidationStatus.SKIPPED,
-            tool="none",
-            output=f"No working linter found for {language}"
-        )
+            # Same mtime and size as last time: trust the entry without reading the file
+            if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+                cached_issues.extend(LintIssue(**issue) for issue in entry["issues"])
+                continue
+
+            digest = self._hash_file(file_path)
+            if entry and digest and entry["hash"] == digest:
+                # Touched but not changed; store the new mtime so the next run skips hashing
+                entry["mtime_ns"] = stat.st_mtime_ns
+                entry["size"] = stat.st_size
+                refreshed = True
+                cached_issues.extend(LintIssue(**issue) for issue in entry["issues"])
+                continue
 
-    def _is_tool_available(self, tool_name: str) -> bool:
-        """Check if tool is available in PATH"""
+            misses.append(file_path)
+            if digest:
+                signatures[file_path] = {
+                    "hash": digest,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                }
+
+        return cache_header, cache, cached_issues, misses, signatures, refreshed
+
+    def _find_source_files(self, language: str) -> List[str]:
+        """List the repository's source files for a language, relative to repo_path"""
+        extensions = self.LANGUAGE_EXTENSIONS.get(language)
+        if not extensions:
+            return []
+
+        repo_str = str(self.repo_path)
+        return [
+            os.path.relpath(entry.path, repo_str)
+            for entry in walk_files(repo_str)
+            if entry.name.endswith(extensions)
+        ]
+
+    def _hash_file(self, file_path: str) -> Optional[str]:
+        """Hash file contents (None if the file can't be read)"""
         try:
-            # Special case for cargo-based tools
-            if tool_name == "rustfmt":
-                subprocess.run(
-                    ["cargo", "fmt", "--version"],
-                    capture_output=True,
-                    timeout=5
-                )
-                return True
+            content = (self.repo_path / file_path).read_bytes()
+        except OSError:
+            return None
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
 
-            subprocess.run(
-                [tool_name, "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+    def _cache_header(self, linter_config: Dict) -> str:
+        """
+        Digest of what a linter's results depend on besides the files linted.
+
+        Args:
+            linter_config: Entry from LINTERS
+
+        Returns:
+            Hex digest of the tool's version and its config files' contents
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(_tool_version(linter_config["name"]).encode())
+
+        for config_file in linter_config["config_files"]:
+            digest.update(b"\0" + config_file.encode() + b"\0")
+            try:
+                digest.update((self.repo_path / config_file).read_bytes())
+            except OSError:
+                digest.update(b"\0missing")
+
+        return digest.hexdigest()
+
+    def _load_cache(self, tool: str, header: str) -> Dict[str, Dict]:
+        """Load the per-file issue cache for a tool (empty if header doesn't match)"""
+        import json  # Deferred: only sessions that lint touch the cache
+
+        try:
+            with open(self.cache_dir / f"{tool}.json", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        # Written by another tool version or config: every entry is stale
+        if not isinstance(data, dict) or data.get("header") != header:
+            return {}
+        return data.get("files", {})
+
+    def _update_cache(
+        self,
+        tool: str,
+        header: str,
+        cache: Dict[str, Dict],
+        signatures: Dict[str, Dict],
+        issues: List[LintIssue]
+    ):
+        """Record freshly linted files (including clean ones) in the cache"""
+        by_file: Dict[str, List[Dict]] = {}
+        for issue in issues:
+            by_file.setdefault(os.path.normpath(issue.file_path), []).append(issue._asdict())
+
+        for file_path, signature in signatures.items():
+            key = os.path.normpath(file_path)
+            cache[key] = {**signature, "issues": by_file.get(key, [])}
+
+        self._save_cache(tool, header, cache)
+
+    def _save_cache(self, tool: str, header: str, cache: Dict[str, Dict]):
+        """Write the per-file issue cache for a tool, tagged with its header"""
+        import json  # Deferred: only sessions that lint touch the cache
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / f"{tool}.json", "w", encoding="utf-8") as f:
+                json.dump({"header": header, "files": cache}, f)
+        except OSError:
+            pass  # Caching is best-effort
+
+    async def _execute_chunked(
+        self,
+        linter_config: Dict,
+        files: List[str],
+        parse_issues: bool
+    ) -> Optional[LintResult]:
+        """
+        Lint a long file list as parallel chunks and merge the results.
+
+        Keeps each command line well under ARG_MAX and uses more than one
+        core for single-threaded linters.
+
+        Args:
+            linter_config: Entry from LINTERS
+            files: Files to lint (longer than FILE_CHUNK_SIZE)
+            parse_issues: Whether to build LintIssue objects
+
+        Returns:
+            Merged LintResult, or None if the tool could not be started
+        """
+        size = self.FILE_CHUNK_SIZE
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async def run_chunk(chunk: List[str]) -> Optional[LintResult]:
+            async with semaphore:
+                return await self._execute_linter(linter_config, chunk, parse_issues)
+
+        results = await asyncio.gather(*(
+            run_chunk(files[start:start + size]) for start in range(0, len(files), size)
+        ))
+
+        if any(result is None for result in results):
+            return None
+
+        for result in results:
+            if result.status not in (ValidationStatus.PASSED, ValidationStatus.FAILED):
+                return result
+
+        merged = results[0]
+        for result in results[1:]:
+            merged.issues.extend(result.issues)
+            merged.total_issues += result.total_issues
+            merged.errors += result.errors
+            merged.warnings += result.warnings
+            if result.status == ValidationStatus.FAILED:
+                merged.status = ValidationStatus.FAILED
+        merged.output = "\n".join(result.output for result in results)
+
+        return merged
+
+    def _merge_cached_issues(
+        self,
+        lint_result: LintResult,
+        cached_issues: List[LintIssue]
+    ) -> LintResult:
+        """Fold cached issues for unchanged files into a fresh result"""
+        if not cached_issues:
+            return lint_result
+
+        cached_errors = sum(1 for issue in cached_issues if issue.severity in ("error", "fatal"))
+
+        lint_result.issues.extend(cached_issues)
+        lint_result.total_issues += len(cached_issues)
+        lint_result.errors += cached_errors
+        lint_result.warnings += len(cached_issues) - cached_errors
+        if lint_result.errors:
+            lint_result.status = ValidationStatus.FAILED
+
+        return lint_result
+
+    def _probe_all(self, linter_configs: List[Dict]) -> Set[str]:
+        """Return the names of the linters that are installed"""
+        return {
+            linter_config["name"] for linter_config in linter_configs
+            if self._is_tool_available(linter_config["name"])
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _is_tool_available(tool_name: str) -> bool:
+        """Check if tool is available in PATH (cached, no process spawn)"""
+        # Special case for cargo-based tools
+        if tool_name == "rustfmt":
+            return is_on_path("cargo")
+
+        return is_on_path(tool_name)
 
     def _parse_linter_output(
         self,
         tool: str,
-        stdout: str,
-        stderr: str,
+        stdout: bytes,
+        stderr: bytes,
         return_code: int,
-        supports_json: bool
+        supports_json: bool,
+        parse_issues: bool = True
     ) -> LintResult:
         """
         Parse output from linter.
 
+        Output stays as bytes: JSON decoders accept bytes directly and the
+        line-scan parsers use bytes patterns, so the full text is decoded
+        only once, for LintResult.output.
+
         Args:
             tool: Tool name
-            stdout: Standard output
-            stderr: Standard error
+            stdout: Raw standard output
+            stderr: Raw standard error
             return_code: Return code
             supports_json: Whether tool supports JSON output
+            parse_issues: Whether text parsers should build LintIssue objects
 
         Returns:
             Parsed LintResult
         """
-        output = stdout + "\n" + stderr
-
         # Try JSON parsing first if supported
-        if supports_json and stdout.strip():
+        if supports_json and _JSON_START_RE.match(stdout):
             try:
                 json_result = self._parse_json_output(tool, stdout)
                 if json_result:
@@ -219,61 +638,48 @@ class Linter:
                 pass  # Fall back to text parsing
 
         # Text parsing by tool
-        if tool == "pylint":
-            return self._parse_pylint_output(output, return_code)
-        elif tool == "flake8":
-            return self._parse_flake8_output(output, return_code)
-        elif tool == "eslint":
-            return self._parse_eslint_text_output(output, return_code)
-        elif tool == "rubocop":
-            return self._parse_rubocop_text_output(output, return_code)
-        elif tool == "rustfmt":
-            return self._parse_rustfmt_output(output, return_code)
-        else:
-            return self._parse_generic_output(tool, output, return_code)
+        parser = self._TEXT_PARSERS.get(tool)
+        if parser is None:
+            return self._parse_generic_output(tool, stdout, stderr, return_code)
+        return parser(self, stdout, stderr, return_code, parse_issues)
 
-    def _parse_json_output(self, tool: str, json_str: str) -> Optional[LintResult]:
+    def _parse_json_output(self, tool: str, raw_json: bytes) -> Optional[LintResult]:
         """Parse JSON output from linters"""
         try:
-            data = json.loads(json_str)
+            data = _json_loads(raw_json)
 
-            if tool == "eslint":
-                return self._parse_eslint_json(data)
-            elif tool == "rubocop":
-                return self._parse_rubocop_json(data)
-            elif tool == "pylint":
-                return self._parse_pylint_json(data)
+            parser = self._JSON_PARSERS.get(tool)
+            if parser is None:
+                return None
 
-            return None
-        except json.JSONDecodeError:
+            # The raw text becomes LintResult.output; no need to re-serialize data
+            return parser(self, data, _decode(raw_json))
+        except ValueError:  # json and orjson decode errors are ValueErrors
             return None
 
-    def _parse_eslint_json(self, data: List[Dict]) -> LintResult:
+    def _parse_eslint_json(self, data: List[Dict], raw_json: str) -> LintResult:
         """Parse ESLint JSON output"""
         issues = []
+        issues_append = issues.append
         error_count = 0
-        warning_count = 0
 
         for file_result in data:
             file_path = file_result.get("filePath", "unknown")
-            for message in file_result.get("messages", []):
-                severity = message.get("severity", 1)
-                severity_name = "error" if severity == 2 else "warning"
-
-                if severity == 2:
-                    error_count += 1
-                else:
-                    warning_count += 1
-
-                issues.append(LintIssue(
-                    severity=severity_name,
-                    message=message.get("message", ""),
-                    file_path=file_path,
-                    line_number=message.get("line"),
-                    column=message.get("column"),
-                    rule=message.get("ruleId")
+            for message in file_result.get("messages", ()):
+                get = message.get
+                is_error = get("severity", 1) == 2
+                error_count += is_error
+
+                issues_append(LintIssue(
+                    _SEVERITY_NAMES[is_error],
+                    get("message", ""),
+                    file_path,
+                    get("line"),
+                    get("column"),
+                    get("ruleId")
                 ))
 
+        warning_count = len(issues) - error_count
         status = ValidationStatus.PASSED if error_count == 0 else ValidationStatus.FAILED
 
         return LintResult(
@@ -283,35 +689,33 @@ class Linter:
             total_issues=len(issues),
             errors=error_count,
             warnings=warning_count,
-            output=json.dumps(data)
+            output=raw_json
         )
 
-    def _parse_rubocop_json(self, data: Dict) -> LintResult:
+    def _parse_rubocop_json(self, data: Dict, raw_json: str) -> LintResult:
         """Parse Rubocop JSON output"""
         issues = []
+        issues_append = issues.append
         error_count = 0
-        warning_count = 0
 
-        for file_result in data.get("files", []):
+        for file_result in data.get("files", ()):
             file_path = file_result.get("path", "unknown")
-            for offense in file_result.get("offenses", []):
-                severity = offense.get("severity", "warning")
-
-                if severity in ("error", "fatal"):
-                    error_count += 1
-                else:
-                    warning_count += 1
-
-                location = offense.get("location", {})
-                issues.append(LintIssue(
-                    severity=severity,
-                    message=offense.get("message", ""),
-                    file_path=file_path,
-                    line_number=location.get("line"),
-                    column=location.get("column"),
-                    rule=offense.get("cop_name")
+            for offense in file_result.get("offenses", ()):
+                get = offense.get
+                severity = get("severity", "warning")
+                error_count += severity in ("error", "fatal")
+
+                location = get("location") or {}
+                issues_append(LintIssue(
+                    severity,
+                    get("message", ""),
+                    file_path,
+                    location.get("line"),
+                    location.get("column"),
+                    get("cop_name")
                 ))
 
+        warning_count = len(issues) - error_count
         status = ValidationStatus.PASSED if error_count == 0 else ValidationStatus.FAILED
 
         return LintResult(
@@ -321,33 +725,30 @@ class Linter:
             total_issues=len(issues),
             errors=error_count,
             warnings=warning_count,
-            output=json.dumps(data)
+            output=raw_json
         )
 
-    def _parse_pylint_json(self, data: List[Dict]) -> LintResult:
+    def _parse_pylint_json(self, data: List[Dict], raw_json: str) -> LintResult:
         """Parse Pylint JSON output"""
         issues = []
+        issues_append = issues.append
         error_count = 0
-        warning_count = 0
 
         for issue_data in data:
-            msg_type = issue_data.get("type", "warning")
-            severity = "error" if msg_type in ("error", "fatal") else "warning"
-
-            if severity == "error":
-                error_count += 1
-            else:
-                warning_count += 1
-
-            issues.append(LintIssue(
-                severity=severity,
-                message=issue_data.get("message", ""),
-                file_path=issue_data.get("path", "unknown"),
-                line_number=issue_data.get("line"),
-                column=issue_data.get("column"),
-                rule=issue_data.get("symbol")
+            get = issue_data.get
+            is_error = get("type", "warning") in ("error", "fatal")
+            error_count += is_error
+
+            issues_append(LintIssue(
+                _SEVERITY_NAMES[is_error],
+                get("message", ""),
+                get("path", "unknown"),
+                get("line"),
+                get("column"),
+                get("symbol")
             ))
 
+        warning_count = len(issues) - error_count
         status = ValidationStatus.PASSED if error_count == 0 else ValidationStatus.FAILED
 
         return LintResult(
@@ -357,33 +758,38 @@ class Linter:
             total_issues=len(issues),
             errors=error_count,
             warnings=warning_count,
-            output=json.dumps(data)
+            output=raw_json
         )
 
-    def _parse_pylint_output(self, output: str, return_code: int) -> LintResult:
-        """Parse Pylint text output"""
-        # Pylint format: file:line:col: C0111: message (code)
-        pattern = r'([^:]+):(\d+):(\d+):\s*([A-Z]\d+):\s*(.+?)\s*\(([^\)]+)\)'
-
+    def _parse_pylint_output(
+        self,
+        stdout: bytes,
+        stderr: bytes,
+        return_code: int,
+        parse_issues: bool = True
+    ) -> LintResult:
+        """Parse Pylint text output (counts only when parse_issues is False)"""
         issues = []
-        for line in output.split('\n'):
-            match = re.match(pattern, line.strip())
+        total = 0
+        errors = 0
+        for line in chain(stdout.splitlines(), stderr.splitlines()):
+            match = _PYLINT_RE.match(line.strip())
             if match:
                 code = match.group(4)
                 # First letter indicates type: C=convention, R=refactor, W=warning, E=error, F=fatal
-                severity = "error" if code[0] in ("E", "F") else "warning"
-
-                issues.append(LintIssue(
-                    severity=severity,
-                    message=match.group(5),
-                    file_path=match.group(1),
-                    line_number=int(match.group(2)),
-                    column=int(match.group(3)),
-                    rule=match.group(6)
-                ))
-
-        errors = sum(1 for issue in issues if issue.severity == "error")
-        warnings = sum(1 for issue in issues if issue.severity == "warning")
+                is_error = code[:1] in (b"E", b"F")
+                total += 1
+                errors += is_error
+
+                if parse_issues:
+                    issues.append(LintIssue(
+                        severity=_SEVERITY_NAMES[is_error],
+                        message=_decode(match.group(5)),
+                        file_path=_decode(match.group(1)),
+                        line_number=int(match.group(2)),
+                        column=int(match.group(3)),
+                        rule=_decode(match.group(6))
+                    ))
 
         status = ValidationStatus.PASSED if errors == 0 else ValidationStatus.FAILED
 
@@ -391,29 +797,36 @@ class Linter:
             status=status,
             tool="pylint",
             issues=issues,
-            total_issues=len(issues),
+            total_issues=total,
             errors=errors,
-            warnings=warnings,
-            output=output
+            warnings=total - errors,
+            output=_combined_output(stdout, stderr)
         )
 
-    def _parse_flake8_output(self, output: str, return_code: int) -> LintResult:
-        """Parse Flake8 output"""
-        # Flake8 format: file:line:col: code message
-        pattern = r'([^:]+):(\d+):(\d+):\s*([A-Z]\d+)\s+(.+)'
-
+    def _parse_flake8_output(
+        self,
+        stdout: bytes,
+        stderr: bytes,
+        return_code: int,
+        parse_issues: bool = True
+    ) -> LintResult:
+        """Parse Flake8 output (counts only when parse_issues is False)"""
         issues = []
-        for line in output.split('\n'):
-            match = re.match(pattern, line.strip())
+        total = 0
+        for line in chain(stdout.splitlines(), stderr.splitlines()):
+            match = _FLAKE8_RE.match(line.strip())
             if match:
+                total += 1
+                if not parse_issues:
+                    continue
                 # Flake8 treats everything as error
                 issues.append(LintIssue(
                     severity="warning",  # Flake8 issues are typically warnings
-                    message=match.group(5),
-                    file_path=match.group(1),
+                    message=_decode(match.group(5)),
+                    file_path=_decode(match.group(1)),
                     line_number=int(match.group(2)),
                     column=int(match.group(3)),
-                    rule=match.group(4)
+                    rule=_decode(match.group(4))
                 ))
 
         # Flake8 doesn't distinguish errors/warnings, consider all as warnings
@@ -423,17 +836,25 @@ class Linter:
             status=status,
             tool="flake8",
             issues=issues,
-            total_issues=len(issues),
+            total_issues=total,
             errors=0,
-            warnings=len(issues),
-            output=output
+            warnings=total,
+            output=_combined_output(stdout, stderr)
         )
 
-    def _parse_eslint_text_output(self, output: str, return_code: int) -> LintResult:
+    def _parse_eslint_text_output(
+        self,
+        stdout: bytes,
+        stderr: bytes,
+        return_code: int,
+        parse_issues: bool = True
+    ) -> LintResult:
         """Parse ESLint text output (fallback)"""
+        output = _combined_output(stdout, stderr)
+
         # Count errors and warnings from summary
-        error_match = re.search(r'(\d+)\s+error', output)
-        warning_match = re.search(r'(\d+)\s+warning', output)
+        error_match = _ESLINT_ERROR_RE.search(output)
+        warning_match = _ESLINT_WARNING_RE.search(output)
 
         errors = int(error_match.group(1)) if error_match else 0
         warnings = int(warning_match.group(1)) if warning_match else 0
@@ -450,10 +871,18 @@ class Linter:
             output=output
         )
 
-    def _parse_rubocop_text_output(self, output: str, return_code: int) -> LintResult:
+    def _parse_rubocop_text_output(
+        self,
+        stdout: bytes,
+        stderr: bytes,
+        return_code: int,
+        parse_issues: bool = True
+    ) -> LintResult:
         """Parse Rubocop text output (fallback)"""
+        output = _combined_output(stdout, stderr)
+
         # Count offenses from summary
-        offense_match = re.search(r'(\d+)\s+offense', output)
+        offense_match = _RUBOCOP_OFFENSE_RE.search(output)
         offenses = int(offense_match.group(1)) if offense_match else 0
 
         status = ValidationStatus.PASSED if offenses == 0 else ValidationStatus.FAILED
@@ -468,8 +897,16 @@ class Linter:
             output=output
         )
 
-    def _parse_rustfmt_output(self, output: str, return_code: int) -> LintResult:
+    def _parse_rustfmt_output(
+        self,
+        stdout: bytes,
+        stderr: bytes,
+        return_code: int,
+        parse_issues: bool = True
+    ) -> LintResult:
         """Parse rustfmt output"""
+        output = _combined_output(stdout, stderr)
+
         # rustfmt outputs differences if format doesn't match
         has_issues = return_code != 0 or "Diff" in output
 
@@ -485,11 +922,22 @@ class Linter:
             output=output
         )
 
-    def _parse_generic_output(self, tool: str, output: str, return_code: int) -> LintResult:
+    def _parse_generic_output(
+        self,
+        tool: str,
+        stdout: bytes,
+        stderr: bytes,
+        return_code: int
+    ) -> LintResult:
         """Generic parser for unknown linters"""
+        output = _combined_output(stdout, stderr)
+
         # Try to count errors/warnings
-        error_count = len(re.findall(r'\berror\b', output, re.IGNORECASE))
-        warning_count = len(re.findall(r'\bwarning\b', output, re.IGNORECASE))
+        # One scan for both words; lastindex tells which alternative matched
+        counts = [0, 0, 0]
+        for match in _GENERIC_SEVERITY_RE.finditer(output):
+            counts[match.lastindex] += 1
+        error_count, warning_count = counts[1], counts[2]
 
         status = ValidationStatus.PASSED if error_count == 0 else ValidationStatus.FAILED
 
@@ -502,3 +950,18 @@ class Linter:
             warnings=warning_count,
             output=output
         )
+
+    # Parser dispatch tables (defined after the methods they reference)
+    _TEXT_PARSERS = {
+        "pylint": _parse_pylint_output,
+        "flake8": _parse_flake8_output,
+        "eslint": _parse_eslint_text_output,
+        "rubocop": _parse_rubocop_text_output,
+        "rustfmt": _parse_rustfmt_output,
+    }
+
+    _JSON_PARSERS = {
+        "eslint": _parse_eslint_json,
+        "rubocop": _parse_rubocop_json,
+        "pylint": _parse_pylint_json,
+    }
@@ -5,7 +5,8 @@ Provides user interaction when no tests are found, allowing the user to decide h
 """
 
 from enum import Enum
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Tuple
 from dataclasses import dataclass
 
 from .detector import TestDetectionResult, ValidationTier
@@ -19,7 +20,70 @@ class NoTestsDecision(Enum):
     ABORT = "abort"  # Abort the task
 
 
-@dataclass
+# Response keywords in priority order. Abort and skip come first because the
+# "Skip validation and create PR anyway" option also mentions "validation"
+# and "create".
+_RESPONSE_KEYWORDS = (
+    ("abort", NoTestsDecision.ABORT),
+    ("cancel", NoTestsDecision.ABORT),
+    ("skip", NoTestsDecision.SKIP_VALIDATION),
+    ("create", NoTestsDecision.CREATE_TESTS),
+    ("proceed", NoTestsDecision.PROCEED_WITH_VALIDATION),
+    ("fallback", NoTestsDecision.PROCEED_WITH_VALIDATION),
+    ("validation", NoTestsDecision.PROCEED_WITH_VALIDATION),
+)
+
+
+@lru_cache(maxsize=16)
+def _question_text(
+    language: Optional[str],
+    test_directories: Tuple[str, ...],
+    test_file_count: int,
+    tier_values: Tuple[str, ...]
+) -> str:
+    """Format the no-tests question from the detection fields it depends on"""
+    question = f"""⚠️ No tests found in {language or "this project"} repository.
+
+**Detection Results:**
+- Language: {language or 'Unknown'}
+- Test directories searched: {', '.join(test_directories) if test_directories else 'None found'}
+- Test files found: {test_file_count}
+"""
+
+    # Add available fallback tiers
+    if tier_values:
+        question += f"\n**Available fallback validation:**\n- {', '.join(tier_values)}\n"
+
+    question += "\n**How would you like to proceed?**"
+
+    return question
+
+
+@lru_cache(maxsize=16)
+def _question_options(fallback_tier: Optional[str], suggest_test_creation: bool) -> Tuple[str, ...]:
+    """Build the multiple choice options; returned as a tuple so cached values stay immutable"""
+    options = []
+
+    # Option 1: Proceed with fallback validation
+    if fallback_tier:
+        options.append(f"Proceed with fallback validation ({fallback_tier})")
+    else:
+        options.append("Proceed with syntax checking only")
+
+    # Option 2: Create tests (if enabled in config)
+    if suggest_test_creation:
+        options.append("Ask the agent to create basic tests first")
+
+    # Option 3: Skip validation
+    options.append("Skip validation and create PR anyway")
+
+    # Option 4: Abort
+    options.append("Abort this task")
+
+    return tuple(options)
+
+
+@dataclass(slots=True)
 class NoTestsConfig:
     """Configuration for no-tests behavior"""
     default_behavior: str = "ask"  # ask, proceed, skip, abort
@@ -98,24 +162,13 @@ class NoTestsHandler:
         Returns:
             Formatted question text
         """
-        language = detection_result.language or "this project"
-
-        question = f"""⚠️ No tests found in {language} repository.
-
-**Detection Results:**
-- Language: {detection_result.language or 'Unknown'}
-- Test directories searched: {', '.join(detection_result.test_directories) if detection_result.test_directories else 'None found'}
-- Test files found: {len(detection_result.test_files)}
-"""
-
-        # Add available fallback tiers
-        if detection_result.available_tiers:
-            tiers_text = ", ".join([tier.value for tier in detection_result.available_tiers])
-            question += f"\n**Available fallback validation:**\n- {tiers_text}\n"
-
-        question += "\n**How would you like to proceed?**"
-
-        return question
+        # Keyed on the fields the text uses; TestDetectionResult itself is mutable
+        return _question_text(
+            detection_result.language,
+            tuple(detection_result.test_directories),
+            len(detection_result.test_files),
+            tuple(tier.value for tier in detection_result.available_tiers)
+        )
 
     def get_question_options(self, detection_result: TestDetectionResult) -> List[str]:
         """
@@ -127,26 +180,14 @@ class NoTestsHandler:
         Returns:
             List of option strings
         """
-        options = []
-
-        # Option 1: Proceed with fallback validation
-        if detection_result.available_tiers:
-            fallback_tier = detection_result.available_tiers[0].value if detection_result.available_tiers else "syntax checking"
-            options.append(f"Proceed with fallback validation ({fallback_tier})")
-        else:
-            options.append("Proceed with syntax checking only")
-
-        # Option 2: Create tests (if enabled in config)
-        if self.config.suggest_test_creation:
-            options.append("Ask the agent to create basic tests first")
-
-        # Option 3: Skip validation
-        options.append("Skip validation and create PR anyway")
-
-        # Option 4: Abort
-        options.append("Abort this task")
+        tiers = detection_result.available_tiers
+        options = _question_options(
+            tiers[0].value if tiers else None,
+            self.config.suggest_test_creation
+        )
 
-        return options
+        # Fresh list per call so callers can't alter the cached options
+        return list(options)
 
     def parse_user_response(self, user_response: str, options: List[str]) -> NoTestsDecision:
         """
@@ -159,20 +200,21 @@ class NoTestsHandler:
         Returns:
             NoTestsDecision based on response
         """
-        response_lower = user_response.lower().strip()
+        response_lower = user_response.lower()
+
+        # First keyword found wins, so the table order is the priority order
+        decision = next(
+            (decision for keyword, decision in _RESPONSE_KEYWORDS if keyword in response_lower),
+            None
+        )
+        if decision is not None:
+            return decision
 
-        # Map responses to decisions
-        if "proceed" in response_lower or "fallback" in response_lower or "validation" in response_lower:
-            return NoTestsDecision.PROCEED_WITH_VALIDATION
-        elif "create" in response_lower or "test" in response_lower and "create" in options[1].lower() if len(options) > 1 else False:
+        # A bare mention of tests only means "create them" if that was offered
+        if "test" in response_lower and any("create" in option.lower() for option in options):
             return NoTestsDecision.CREATE_TESTS
-        elif "skip" in response_lower:
-            return NoTestsDecision.SKIP_VALIDATION
-        elif "abort" in response_lower or "cancel" in response_lower:
-            return NoTestsDecision.ABORT
 
-        # Default to proceed if unclear
-        return NoTestsDecision.PROCEED_WITH_VALIDATION
+        return NoTestsDecision.PROCEED_WITH_VALIDATION  # Default to proceed if unclear
 
     def format_decision_explanation(self, decision: NoTestsDecision, detection_result: TestDetectionResult) -> str:
         """
@@ -5,16 +5,24 @@ Coordinates the entire validation workflow including test detection, user intera
 execution, and fallback validation tiers.
 """
 
+import asyncio
+import atexit
+import os
+import re
 import time
-from typing import Optional, List, Callable, Awaitable, Any
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Optional, List, Callable, Awaitable, Any, Dict, Tuple, ClassVar, TYPE_CHECKING
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 
 from .detector import (
     TestFrameworkDetector,
     ValidationTierDetector,
     TestDetectionResult,
-    ValidationTier
+    ValidationTier,
+    _EXT_TO_LANG
 )
 from .no_tests_handler import NoTestsHandler, NoTestsDecision, NoTestsConfig
 from .result_types import (
@@ -25,11 +33,98 @@ from .result_types import (
     LintResult,
     SyntaxResult
 )
-from .runner import TestRunner
-from .static_analyzer import StaticAnalyzer
-from .linter import Linter
-from .syntax_checker import SyntaxChecker
-from .dependency_validator import DependencyValidator, DependencyResult
+
+# Tool runners are imported where they're used: a run typically needs only
+# one or two of them
+if TYPE_CHECKING:
+    from .dependency_validator import DependencyResult
+
+
+# Seconds a detection result is reused while the repo root looks unchanged.
+# Changes below the top-level directories don't touch the fingerprint, so the
+# TTL bounds how stale a result can get.
+DETECTION_CACHE_TTL = 60.0
+
+# repo path -> (time stored, root fingerprint, detection result)
+_detection_cache: Dict[str, Tuple[float, Tuple, TestDetectionResult]] = {}
+_detection_cache_stats = {"hits": 0, "misses": 0}
+
+# Fallback tiers that run an external tool; without them only syntax checking is left
+_TOOL_TIERS = frozenset({ValidationTier.STATIC_ANALYSIS, ValidationTier.LINTING})
+
+# Fallback tiers from most to least preferred
+_FALLBACK_PRIORITY = (
+    ValidationTier.STATIC_ANALYSIS,
+    ValidationTier.LINTING,
+    ValidationTier.SYNTAX,
+)
+
+# Fixed (status, summary, details) for no-tests decisions that stop validation
+_NO_TESTS_OUTCOMES = {
+    NoTestsDecision.ABORT: (
+        ValidationStatus.ERROR,
+        "Task aborted: No tests found and user chose to abort",
+        "",
+    ),
+    NoTestsDecision.SKIP_VALIDATION: (
+        ValidationStatus.SKIPPED,
+        "Validation skipped by user decision",
+        "User chose to skip validation and proceed directly to PR creation.",
+    ),
+    NoTestsDecision.CREATE_TESTS: (
+        ValidationStatus.SKIPPED,
+        "Test creation requested",
+        "User requested that tests be created before proceeding. This requires manual implementation.",
+    ),
+}
+
+# Error messages meaning the test tool itself isn't installed
+_TOOL_MISSING_RE = re.compile(
+    r"no such file or directory|command not found|not found|cannot find",
+    re.IGNORECASE
+)
+
+
+def _root_fingerprint(repo_path: str) -> Tuple:
+    """
+    Fingerprint the repository root with a single scandir.
+
+    Covers every root-level config file (pyproject.toml, package.json, go.mod,
+    ...) and the top-level directories, whose mtimes change when entries such
+    as test files are added or removed directly inside them.
+
+    Args:
+        repo_path: Path to repository root
+
+    Returns:
+        Sorted tuple of (name, mtime_ns) pairs
+    """
+    try:
+        with os.scandir(repo_path) as entries:
+            return tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns) for entry in entries
+            ))
+    except OSError:
+        return ()
+
+
+def _group_by_language(files: List[str]) -> Dict[str, List[str]]:
+    """
+    Split files by language using their extension.
+
+    Args:
+        files: File paths
+
+    Returns:
+        Dictionary of language -> files; unrecognized extensions are dropped
+    """
+    by_language: Dict[str, List[str]] = {}
+    ext_to_lang = _EXT_TO_LANG
+    for file_path in files:
+        language = ext_to_lang.get(os.path.splitext(file_path)[1].lower())
+        if language:
+            by_language.setdefault(language, []).append(file_path)
+    return by_language
 
 
 class ValidationOrchestrator:
@@ -44,6 +139,12 @@ class ValidationOrchestrator:
     5. Result aggregation
     """
 
+    # Small shared pool for blocking filesystem detectors, reused across validate() calls
+    _executor: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=4,
+        thread_name_prefix="tarsis-validation"
+    )
+
     def __init__(
         self,
         repo_path: str,
@@ -60,6 +161,8 @@ class ValidationOrchestrator:
                                   (takes question dict, returns user response)
         """
         self.repo_path = Path(repo_path)
+        # Every tool takes the path as a string; convert once
+        self._repo_path_str = str(self.repo_path)
         self.no_tests_handler = NoTestsHandler(no_tests_config)
         self.ask_followup_callback = ask_followup_callback
 
@@ -81,51 +184,100 @@ class ValidationOrchestrator:
         start_time = time.time()
 
         # Step 1: Detect test framework and available tiers
-        detection_result = self._detect_tests_and_tiers()
+        detection_result = await self._detect_tests_and_tiers()
 
         # Step 2: Determine validation strategy
         if detection_result.has_tests:
             # Has tests - run them
-            result = await self._run_tests(detection_result, modified_files)
+            primary = self._run_tests(detection_result, modified_files)
         else:
             # No tests - handle appropriately
-            result = await self._handle_no_tests(detection_result, modified_files)
+            primary = self._handle_no_tests(detection_result, modified_files)
 
         # Step 3: Optionally check dependencies (supplementary check)
         if check_dependencies and detection_result.language:
-            dep_result = await self._check_dependencies(detection_result, modified_files)
-            # Add dependency info to details
-            if dep_result and not dep_result.passed:
-                result.details += f"\n\n**Dependency Check:**\n"
-                result.details += f"- {dep_result.errors} error(s), {dep_result.warnings} warning(s)\n"
-                if dep_result.issues:
-                    result.details += "Issues:\n"
-                    for issue in dep_result.issues[:5]:
-                        result.details += f"  - [{issue.severity}] {issue.message}\n"
+            # Independent of the primary validation, so run both at once
+            result, dep_result = await asyncio.gather(
+                primary,
+                self._check_dependencies(detection_result, modified_files)
+            )
+            # Formatted only when a report is generated (see ValidationReporter)
+            result.dep_result = dep_result
+        else:
+            result = await primary
 
         # Set metadata
         result.duration = time.time() - start_time
-        result.timestamp = datetime.utcnow().isoformat()
+        result.timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
         return result
 
-    def _detect_tests_and_tiers(self) -> TestDetectionResult:
+    @classmethod
+    def detection_cache_info(cls) -> Dict[str, int]:
+        """
+        Report detection cache usage.
+
+        Returns:
+            Dictionary with 'hits', 'misses' and 'size' keys
+        """
+        return {**_detection_cache_stats, "size": len(_detection_cache)}
+
+    @classmethod
+    def clear_detection_cache(cls):
+        """Forget all cached detection results"""
+        _detection_cache.clear()
+        _detection_cache_stats["hits"] = _detection_cache_stats["misses"] = 0
+
+    async def _detect_tests_and_tiers(self) -> TestDetectionResult:
         """
         Detect test framework and available validation tiers.
 
+        Results are reused across calls for the same repository while the
+        root fingerprint is unchanged and DETECTION_CACHE_TTL hasn't expired.
+
+        Returns:
+            TestDetectionResult with detection info
+        """
+        repo_key = self._repo_path_str
+        fingerprint = _root_fingerprint(repo_key)
+        now = time.monotonic()
+
+        cached = _detection_cache.get(repo_key)
+        if cached and cached[1] == fingerprint and now - cached[0] < DETECTION_CACHE_TTL:
+            _detection_cache_stats["hits"] += 1
+            # Shallow copy so callers can't reassign fields on the cached result
+            return replace(cached[2])
+
+        _detection_cache_stats["misses"] += 1
+        detection_result = await self._run_detection()
+        _detection_cache[repo_key] = (now, fingerprint, detection_result)
+
+        return replace(detection_result)
+
+    async def _run_detection(self) -> TestDetectionResult:
+        """
+        Run test framework and validation tier detection.
+
+        Both detectors only read the filesystem and tier detection doesn't
+        depend on the detected language, so they run concurrently on the
+        shared executor.
+
         Returns:
             TestDetectionResult with detection info
         """
-        # Detect test framework
-        detector = TestFrameworkDetector(str(self.repo_path))
-        detection_result = detector.detect()
-
-        # Detect available fallback tiers
-        tier_detector = ValidationTierDetector(
-            str(self.repo_path),
-            language=detection_result.language
+        detector = TestFrameworkDetector(self._repo_path_str)
+        tier_detector = ValidationTierDetector(self._repo_path_str)
+
+        loop = asyncio.get_running_loop()
+        detection_result, available_tiers = await asyncio.gather(
+            loop.run_in_executor(self._executor, detector.detect),
+            loop.run_in_executor(self._executor, tier_detector.detect_available_tiers)
         )
-        detection_result.available_tiers = tier_detector.detect_available_tiers()
+        # Pin the preference order here so fallback can take tiers as listed
+        detected = set(available_tiers)
+        detection_result.available_tiers = [
+            tier for tier in _FALLBACK_PRIORITY if tier in detected
+        ]
 
         return detection_result
 
@@ -144,8 +296,10 @@ class ValidationOrchestrator:
         Returns:
             ValidationResult with test outcomes
         """
+        from .runner import TestRunner
+
         # Create test runner and execute tests
-        runner = TestRunner(str(self.repo_path))
+        runner = TestRunner(self._repo_path_str)
         test_result = await runner.run_tests(detection_result, modified_files)
 
         # Check if no tests were found (0 total tests)
@@ -161,12 +315,7 @@ class ValidationOrchestrator:
         if test_result.status == ValidationStatus.ERROR:
             # Check if this is a "tool not found" error (pytest, jest, etc. not installed)
             error_msg = test_result.error_message or ""
-            is_tool_missing = any(phrase in error_msg.lower() for phrase in [
-                "no such file or directory",
-                "command not found",
-                "not found",
-                "cannot find"
-            ])
+            is_tool_missing = _TOOL_MISSING_RE.search(error_msg) is not None
 
             if is_tool_missing:
                 # Test framework detected but tool not installed - fall back to other tiers
@@ -187,12 +336,15 @@ class ValidationOrchestrator:
             status = ValidationStatus.FAILED
             summary = f"Tests failed: {test_result.failed_tests}/{test_result.total_tests} tests failed"
 
-        details = f"Framework: {detection_result.framework}\n"
-        details += f"Command: {detection_result.test_command}\n"
+        parts = [
+            f"Framework: {detection_result.framework}\n",
+            f"Command: {detection_result.test_command}\n",
+        ]
         if test_result.failures:
-            details += f"\nFailures:\n"
-            for failure in test_result.failures[:5]:  # Show first 5
-                details += f"- {failure.test_name}: {failure.error_message}\n"
+            parts.append("\nFailures:\n")
+            for failure in islice(test_result.failures, 5):  # Show first 5
+                parts.append(f"- {failure.test_name}: {failure.error_message}\n")
+        details = "".join(parts)
 
         return ValidationResult(
             status=status,
@@ -240,33 +392,7 @@ class ValidationOrchestrator:
             user_decision = f"{decision.value} (default behavior)"
 
         # Execute based on decision
-        if decision == NoTestsDecision.ABORT:
-            return ValidationResult(
-                status=ValidationStatus.ERROR,
-                tier_used=ValidationTier.SYNTAX,
-                summary="Task aborted: No tests found and user chose to abort",
-                user_decision=user_decision
-            )
-
-        elif decision == NoTestsDecision.SKIP_VALIDATION:
-            return ValidationResult(
-                status=ValidationStatus.SKIPPED,
-                tier_used=ValidationTier.SYNTAX,
-                summary="Validation skipped by user decision",
-                details="User chose to skip validation and proceed directly to PR creation.",
-                user_decision=user_decision
-            )
-
-        elif decision == NoTestsDecision.CREATE_TESTS:
-            return ValidationResult(
-                status=ValidationStatus.SKIPPED,
-                tier_used=ValidationTier.SYNTAX,
-                summary="Test creation requested",
-                details="User requested that tests be created before proceeding. This requires manual implementation.",
-                user_decision=user_decision
-            )
-
-        elif decision == NoTestsDecision.PROCEED_WITH_VALIDATION:
+        if decision == NoTestsDecision.PROCEED_WITH_VALIDATION:
             # Proceed with fallback validation
             return await self._run_fallback_validation(
                 detection_result,
@@ -274,11 +400,16 @@ class ValidationOrchestrator:
                 user_decision
             )
 
-        # Should never reach here
+        # Every other decision ends validation here with a fixed result
+        status, summary, details = _NO_TESTS_OUTCOMES.get(
+            decision,
+            (ValidationStatus.ERROR, "Unknown decision state", "")
+        )
         return ValidationResult(
-            status=ValidationStatus.ERROR,
+            status=status,
             tier_used=ValidationTier.SYNTAX,
-            summary="Unknown decision state",
+            summary=summary,
+            details=details,
             user_decision=user_decision
         )
 
@@ -301,26 +432,49 @@ class ValidationOrchestrator:
         """
         available_tiers = detection_result.available_tiers
 
-        if not available_tiers:
+        if _TOOL_TIERS.isdisjoint(available_tiers):
             # Only syntax checking available
             return await self._run_syntax_check(modified_files, user_decision)
 
-        # Try tiers in order of preference
-        for tier in available_tiers:
-            if tier == ValidationTier.STATIC_ANALYSIS:
-                result = await self._run_static_analysis(detection_result, modified_files)
-                if result.status != ValidationStatus.ERROR:
-                    result.user_decision = user_decision
-                    return result
+        # Analyzers and linters are language-specific: filter the modified
+        # files once here rather than handing every tool files it can't check
+        language_files = modified_files
+        if modified_files is not None:
+            language_files = _group_by_language(modified_files).get(detection_result.language, [])
+            if not language_files:
+                # Nothing in the tools' language changed. An empty file list
+                # would make them check the whole repository, so only
+                # syntax-check what did change
+                return await self._run_syntax_check(modified_files, user_decision)
+
+        # Tiers are independent and read-only, so start them all at once and
+        # take the first one (in order of preference) that didn't error
+        tier_runners = {
+            ValidationTier.STATIC_ANALYSIS: self._run_static_analysis,
+            ValidationTier.LINTING: self._run_linting,
+        }
+        # available_tiers is already in preference order (see _run_detection)
+        tasks = [
+            asyncio.create_task(tier_runners[tier](detection_result, language_files))
+            for tier in available_tiers
+            if tier in tier_runners
+        ]
+        # Syntax checking is the last resort
+        tasks.append(asyncio.create_task(self._run_syntax_check(modified_files, user_decision)))
 
-            elif tier == ValidationTier.LINTING:
-                result = await self._run_linting(detection_result, modified_files)
+        try:
+            for task in tasks[:-1]:
+                result = await task
                 if result.status != ValidationStatus.ERROR:
-                    result.user_decision = user_decision
-                    return result
+                    break
+            else:
+                result = await tasks[-1]
+        finally:
+            # Stop lower-priority tiers that are still running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Fall back to syntax checking
-        result = await self._run_syntax_check(modified_files, user_decision)
         result.user_decision = user_decision
         return result
 
@@ -339,8 +493,10 @@ class ValidationOrchestrator:
         Returns:
             ValidationResult with static analysis outcomes
         """
+        from .static_analyzer import StaticAnalyzer
+
         # Create static analyzer and run
-        analyzer = StaticAnalyzer(str(self.repo_path))
+        analyzer = StaticAnalyzer(self._repo_path_str)
         analysis_result = await analyzer.run_analysis(
             detection_result.language,
             modified_files
@@ -360,12 +516,15 @@ class ValidationOrchestrator:
             status = ValidationStatus.FAILED
             summary = f"Static analysis failed: {analysis_result.errors} error(s), {analysis_result.warnings} warning(s) found by {analysis_result.tool}"
 
-        details = f"Tool: {analysis_result.tool}\n"
-        details += f"Language: {detection_result.language}\n"
+        parts = [
+            f"Tool: {analysis_result.tool}\n",
+            f"Language: {detection_result.language}\n",
+        ]
         if analysis_result.issues:
-            details += f"\nTop issues:\n"
-            for issue in analysis_result.issues[:5]:
-                details += f"- {issue.file_path}:{issue.line_number} [{issue.severity}] {issue.message}\n"
+            parts.append("\nTop issues:\n")
+            for issue in islice(analysis_result.issues, 5):
+                parts.append(f"- {issue.file_path}:{issue.line_number} [{issue.severity}] {issue.message}\n")
+        details = "".join(parts)
 
         return ValidationResult(
             status=status,
@@ -390,8 +549,10 @@ class ValidationOrchestrator:
         Returns:
             ValidationResult with linting outcomes
         """
+        from .linter import Linter
+
         # Create linter and run
-        linter = Linter(str(self.repo_path))
+        linter = Linter(self._repo_path_str)
         lint_result = await linter.run_linting(
             detection_result.language,
             modified_files
@@ -411,12 +572,15 @@ class ValidationOrchestrator:
             status = ValidationStatus.FAILED
             summary = f"Linting failed: {lint_result.errors} error(s), {lint_result.warnings} warning(s) found by {lint_result.tool}"
 
-        details = f"Tool: {lint_result.tool}\n"
-        details += f"Language: {detection_result.language}\n"
+        parts = [
+            f"Tool: {lint_result.tool}\n",
+            f"Language: {detection_result.language}\n",
+        ]
         if lint_result.issues:
-            details += f"\nTop issues:\n"
-            for issue in lint_result.issues[:5]:
-                details += f"- {issue.file_path}:{issue.line_number} [{issue.severity}] {issue.message}\n"
+            parts.append("\nTop issues:\n")
+            for issue in islice(lint_result.issues, 5):
+                parts.append(f"- {issue.file_path}:{issue.line_number} [{issue.severity}] {issue.message}\n")
+        details = "".join(parts)
 
         return ValidationResult(
             status=status,
@@ -441,8 +605,10 @@ class ValidationOrchestrator:
         Returns:
             ValidationResult with syntax check outcomes
         """
+        from .syntax_checker import SyntaxChecker
+
         # Create syntax checker and run
-        checker = SyntaxChecker(str(self.repo_path))
+        checker = SyntaxChecker(self._repo_path_str)
         syntax_result = await checker.check_syntax(modified_files)
 
         # Determine overall status
@@ -459,14 +625,15 @@ class ValidationOrchestrator:
             status = ValidationStatus.FAILED
             summary = f"Syntax check failed: {syntax_result.total_errors} error(s) found in {syntax_result.files_checked} file(s)"
 
-        details = f"Files checked: {syntax_result.files_checked}\n"
+        parts = [f"Files checked: {syntax_result.files_checked}\n"]
         if syntax_result.errors:
-            details += f"\nSyntax errors:\n"
-            for error in syntax_result.errors[:5]:
+            parts.append("\nSyntax errors:\n")
+            for error in islice(syntax_result.errors, 5):
                 loc = f"{error.file_path}"
                 if error.line_number:
                     loc += f":{error.line_number}"
-                details += f"- {loc}: {error.message}\n"
+                parts.append(f"- {loc}: {error.message}\n")
+        details = "".join(parts)
 
         return ValidationResult(
             status=status,
@@ -481,7 +648,7 @@ class ValidationOrchestrator:
         self,
         detection_result: TestDetectionResult,
         modified_files: Optional[List[str]] = None
-    ) -> Optional[DependencyResult]:
+    ) -> Optional["DependencyResult"]:
         """
         Check dependencies and imports (supplementary validation).
 
@@ -492,8 +659,10 @@ class ValidationOrchestrator:
         Returns:
             DependencyResult or None if skipped
         """
+        from .dependency_validator import DependencyValidator
+
         try:
-            validator = DependencyValidator(str(self.repo_path))
+            validator = DependencyValidator(self._repo_path_str)
             result = await validator.validate_dependencies(
                 detection_result.language,
                 modified_files
@@ -502,3 +671,6 @@ class ValidationOrchestrator:
         except Exception as e:
             # Don't fail the whole validation if dependency check fails
             return None
+
+
+atexit.register(ValidationOrchestrator._executor.shutdown, wait=False)
@@ -4,7 +4,8 @@ Validation result reporter.
 Formats validation results for different outputs: PR comments, status badges, and agent feedback.
 """
 
-from typing import Optional
+from itertools import islice
+from typing import Optional, TYPE_CHECKING
 from .result_types import (
     ValidationResult,
     ValidationStatus,
@@ -15,6 +16,28 @@ from .result_types import (
 )
 from .detector import ValidationTier
 
+if TYPE_CHECKING:
+    from .dependency_validator import DependencyResult
+
+
+# Badge text per status
+_BADGES = {
+    ValidationStatus.PASSED: "✅ PASSED",
+    ValidationStatus.FAILED: "❌ FAILED",
+    ValidationStatus.SKIPPED: "⏭️ SKIPPED",
+    ValidationStatus.ERROR: "⚠️ ERROR",
+}
+
+# Display title per tier, e.g. "static_analysis" -> "Static Analysis"
+_TIER_TITLES = {tier: tier.value.replace("_", " ").title() for tier in ValidationTier}
+
+# Section templates shared by the _format_*_result helpers
+_TEST_HEADER = "### Test Results\n\n"
+_SYNTAX_HEADER = "### Syntax Checking\n\n"
+_TEST_STATS_FMT = "- **Total:** {}\n- **Passed:** {} ✅\n- **Failed:** {} ❌\n"
+_ISSUE_STATS_FMT = "- **Total Issues:** {}\n- **Errors:** {} ❌\n- **Warnings:** {} ⚠️\n\n"
+_SYNTAX_STATS_FMT = "- **Files Checked:** {}\n- **Errors:** {} ❌\n\n"
+
 
 class ValidationReporter:
     """
@@ -32,15 +55,7 @@ class ValidationReporter:
         Returns:
             Badge text (emoji + status)
         """
-        if result.status == ValidationStatus.PASSED:
-            return "✅ PASSED"
-        elif result.status == ValidationStatus.FAILED:
-            return "❌ FAILED"
-        elif result.status == ValidationStatus.SKIPPED:
-            return "⏭️ SKIPPED"
-        elif result.status == ValidationStatus.ERROR:
-            return "⚠️ ERROR"
-        return "❓ UNKNOWN"
+        return _BADGES.get(result.status, "❓ UNKNOWN")
 
     @staticmethod
     def generate_pr_comment(result: ValidationResult) -> str:
@@ -54,175 +69,203 @@ class ValidationReporter:
             Markdown-formatted comment text
         """
         badge = ValidationReporter.generate_status_badge(result)
-        tier_name = result.tier_used.value.replace("_", " ").title()
+        tier_name = _TIER_TITLES[result.tier_used]
 
-        comment = f"""## {badge} Validation Results
-
-**Validation Tier:** {tier_name}
-"""
+        parts = [f"## {badge} Validation Results\n\n**Validation Tier:** {tier_name}\n"]
 
         # Add user decision if present
         if result.user_decision:
-            comment += f"**User Decision:** {result.user_decision}\n"
+            parts.append(f"**User Decision:** {result.user_decision}\n")
 
-        comment += f"**Duration:** {result.duration:.2f}s\n\n"
+        parts.append(f"**Duration:** {result.duration:.2f}s\n\n")
 
         # Add summary
         if result.summary:
-            comment += f"### Summary\n{result.summary}\n\n"
+            parts.append(f"### Summary\n{result.summary}\n\n")
 
         # Add tier-specific results
         if result.test_result:
-            comment += ValidationReporter._format_test_result(result.test_result)
+            parts.append(ValidationReporter._format_test_result(result.test_result))
         elif result.analysis_result:
-            comment += ValidationReporter._format_analysis_result(result.analysis_result)
+            parts.append(ValidationReporter._format_analysis_result(result.analysis_result))
         elif result.lint_result:
-            comment += ValidationReporter._format_lint_result(result.lint_result)
+            parts.append(ValidationReporter._format_lint_result(result.lint_result))
         elif result.syntax_result:
-            comment += ValidationReporter._format_syntax_result(result.syntax_result)
+            parts.append(ValidationReporter._format_syntax_result(result.syntax_result))
 
         # Add details if present
         if result.details:
-            comment += f"\n### Details\n{result.details}\n"
+            parts.append(f"\n### Details\n{result.details}\n")
+
+        # Add failed dependency check if one was run
+        if result.dep_result and not result.dep_result.passed:
+            parts.append(ValidationReporter._format_dep_result(result.dep_result))
 
         # Add footer
-        comment += "\n---\n*Automated validation by Tarsis*\n"
+        parts.append("\n---\n*Automated validation by Tarsis*\n")
 
-        return comment
+        return "".join(parts)
 
     @staticmethod
     def _format_test_result(test_result: TestResult) -> str:
         """Format test result section"""
-        text = "### Test Results\n\n"
+        parts = [_TEST_HEADER]
 
         if test_result.status == ValidationStatus.ERROR:
-            text += f"⚠️ **Error running tests:** {test_result.error_message}\n"
-            return text
+            parts.append(f"⚠️ **Error running tests:** {test_result.error_message}\n")
+            return "".join(parts)
 
         # Stats
-        text += f"- **Total:** {test_result.total_tests}\n"
-        text += f"- **Passed:** {test_result.passed_tests} ✅\n"
-        text += f"- **Failed:** {test_result.failed_tests} ❌\n"
+        parts.append(_TEST_STATS_FMT.format(
+            test_result.total_tests, test_result.passed_tests, test_result.failed_tests
+        ))
 
         if test_result.skipped_tests > 0:
-            text += f"- **Skipped:** {test_result.skipped_tests} ⏭️\n"
+            parts.append(f"- **Skipped:** {test_result.skipped_tests} ⏭️\n")
 
-        text += f"- **Duration:** {test_result.duration:.2f}s\n\n"
+        parts.append(f"- **Duration:** {test_result.duration:.2f}s\n\n")
 
         # Show failures if any
-        if test_result.failures:
-            text += "#### Failures\n\n"
-            for i, failure in enumerate(test_result.failures[:10], 1):  # Limit to 10
-                text += f"{i}. **{failure.test_name}**\n"
+        failures = test_result.failures
+        total = len(failures)
+        if total:
+            parts.append("#### Failures\n\n")
+            for i in range(min(10, total)):  # Limit to 10
+                failure = failures[i]
+                parts.append(f"{i + 1}. **{failure.test_name}**\n")
                 if failure.file_path:
-                    text += f"   - File: `{failure.file_path}`"
+                    parts.append(f"   - File: `{failure.file_path}`")
                     if failure.line_number:
-                        text += f":{failure.line_number}"
-                    text += "\n"
-                text += f"   - Error: {failure.error_message}\n\n"
+                        parts.append(f":{failure.line_number}")
+                    parts.append("\n")
+                parts.append(f"   - Error: {failure.error_message}\n\n")
 
-            if len(test_result.failures) > 10:
-                text += f"*... and {len(test_result.failures) - 10} more failures*\n\n"
+            if total > 10:
+                parts.append(f"*... and {total - 10} more failures*\n\n")
 
-        return text
+        return "".join(parts)
 
     @staticmethod
     def _format_analysis_result(analysis_result: AnalysisResult) -> str:
         """Format static analysis result section"""
-        text = f"### Static Analysis ({analysis_result.tool})\n\n"
+        parts = [f"### Static Analysis ({analysis_result.tool})\n\n"]
 
         if analysis_result.status == ValidationStatus.ERROR:
-            text += f"⚠️ **Error running analysis:** {analysis_result.error_message}\n"
-            return text
+            parts.append(f"⚠️ **Error running analysis:** {analysis_result.error_message}\n")
+            return "".join(parts)
 
         # Stats
-        text += f"- **Total Issues:** {analysis_result.total_issues}\n"
-        text += f"- **Errors:** {analysis_result.errors} ❌\n"
-        text += f"- **Warnings:** {analysis_result.warnings} ⚠️\n\n"
+        parts.append(_ISSUE_STATS_FMT.format(
+            analysis_result.total_issues, analysis_result.errors, analysis_result.warnings
+        ))
 
         # Show issues if any
-        if analysis_result.issues:
-            text += "#### Issues\n\n"
-            for i, issue in enumerate(analysis_result.issues[:15], 1):  # Limit to 15
+        issues = analysis_result.issues
+        total = len(issues)
+        if total:
+            parts.append("#### Issues\n\n")
+            for i in range(min(15, total)):  # Limit to 15
+                issue = issues[i]
                 severity_icon = "❌" if issue.severity == "error" else "⚠️"
-                text += f"{i}. {severity_icon} `{issue.file_path}`"
-                if issue.line_number:
-                    text += f":{issue.line_number}"
-                    if issue.column:
-                        text += f":{issue.column}"
-                text += "\n"
-                text += f"   - {issue.message}\n"
-                if issue.code:
-                    text += f"   - Code: `{issue.code}`\n"
-                text += "\n"
-
-            if len(analysis_result.issues) > 15:
-                text += f"*... and {len(analysis_result.issues) - 15} more issues*\n\n"
+                # One join per issue instead of up to eight appends
+                parts.append("".join((
+                    f"{i + 1}. {severity_icon} `{issue.file_path}`",
+                    f":{issue.line_number}" if issue.line_number else "",
+                    f":{issue.column}" if issue.line_number and issue.column else "",
+                    f"\n   - {issue.message}\n",
+                    f"   - Code: `{issue.code}`\n" if issue.code else "",
+                    "\n",
+                )))
 
-        return text
+            if total > 15:
+                parts.append(f"*... and {total - 15} more issues*\n\n")
+
+        return "".join(parts)
 
     @staticmethod
     def _format_lint_result(lint_result: LintResult) -> str:
         """Format linting result section"""
-        text = f"### Linting ({lint_result.tool})\n\n"
+        parts = [f"### Linting ({lint_result.tool})\n\n"]
 
         if lint_result.status == ValidationStatus.ERROR:
-            text += f"⚠️ **Error running linter:** {lint_result.error_message}\n"
-            return text
+            parts.append(f"⚠️ **Error running linter:** {lint_result.error_message}\n")
+            return "".join(parts)
 
         # Stats
-        text += f"- **Total Issues:** {lint_result.total_issues}\n"
-        text += f"- **Errors:** {lint_result.errors} ❌\n"
-        text += f"- **Warnings:** {lint_result.warnings} ⚠️\n\n"
+        parts.append(_ISSUE_STATS_FMT.format(
+            lint_result.total_issues, lint_result.errors, lint_result.warnings
+        ))
 
         # Show issues if any
-        if lint_result.issues:
-            text += "#### Issues\n\n"
-            for i, issue in enumerate(lint_result.issues[:15], 1):  # Limit to 15
+        issues = lint_result.issues
+        total = len(issues)
+        if total:
+            parts.append("#### Issues\n\n")
+            for i in range(min(15, total)):  # Limit to 15
+                issue = issues[i]
                 severity_icon = "❌" if issue.severity == "error" else "⚠️"
-                text += f"{i}. {severity_icon} `{issue.file_path}`"
-                if issue.line_number:
-                    text += f":{issue.line_number}"
-                text += "\n"
-                text += f"   - {issue.message}\n"
-                if issue.rule:
-                    text += f"   - Rule: `{issue.rule}`\n"
-                text += "\n"
-
-            if len(lint_result.issues) > 15:
-                text += f"*... and {len(lint_result.issues) - 15} more issues*\n\n"
+                # One join per issue instead of up to six appends
+                parts.append("".join((
+                    f"{i + 1}. {severity_icon} `{issue.file_path}`",
+                    f":{issue.line_number}" if issue.line_number else "",
+                    f"\n   - {issue.message}\n",
+                    f"   - Rule: `{issue.rule}`\n" if issue.rule else "",
+                    "\n",
+                )))
 
-        return text
+            if total > 15:
+                parts.append(f"*... and {total - 15} more issues*\n\n")
+
+        return "".join(parts)
 
     @staticmethod
     def _format_syntax_result(syntax_result: SyntaxResult) -> str:
         """Format syntax checking result section"""
-        text = "### Syntax Checking\n\n"
+        parts = [_SYNTAX_HEADER]
 
         if syntax_result.status == ValidationStatus.ERROR:
-            text += f"⚠️ **Error checking syntax:** {syntax_result.error_message}\n"
-            return text
+            parts.append(f"⚠️ **Error checking syntax:** {syntax_result.error_message}\n")
+            return "".join(parts)
 
         # Stats
-        text += f"- **Files Checked:** {syntax_result.files_checked}\n"
-        text += f"- **Errors:** {syntax_result.total_errors} ❌\n\n"
+        parts.append(_SYNTAX_STATS_FMT.format(syntax_result.files_checked, syntax_result.total_errors))
 
         # Show errors if any
-        if syntax_result.errors:
-            text += "#### Syntax Errors\n\n"
-            for i, error in enumerate(syntax_result.errors[:10], 1):  # Limit to 10
-                text += f"{i}. ❌ `{error.file_path}`"
+        errors = syntax_result.errors
+        total = len(errors)
+        if total:
+            parts.append("#### Syntax Errors\n\n")
+            for i in range(min(10, total)):  # Limit to 10
+                error = errors[i]
+                parts.append(f"{i + 1}. ❌ `{error.file_path}`")
                 if error.line_number:
-                    text += f":{error.line_number}"
+                    parts.append(f":{error.line_number}")
                     if error.column:
-                        text += f":{error.column}"
-                text += "\n"
-                text += f"   - {error.message}\n\n"
+                        parts.append(f":{error.column}")
+                parts.append("\n")
+                parts.append(f"   - {error.message}\n\n")
 
-            if len(syntax_result.errors) > 10:
-                text += f"*... and {len(syntax_result.errors) - 10} more errors*\n\n"
+            if total > 10:
+                parts.append(f"*... and {total - 10} more errors*\n\n")
 
-        return text
+        return "".join(parts)
+
+    @staticmethod
+    def _format_dep_result(dep_result: "DependencyResult") -> str:
+        """Format dependency check section"""
+        parts = [
+            "\n### Dependency Check\n\n",
+            f"- {dep_result.errors} error(s), {dep_result.warnings} warning(s)\n",
+        ]
+
+        issues = dep_result.issues
+        if issues:
+            parts.append("\nIssues:\n")
+            for i in range(min(5, len(issues))):
+                issue = issues[i]
+                parts.append(f"  - [{issue.severity}] {issue.message}\n")
+
+        return "".join(parts)
 
     @staticmethod
     def format_for_agent(result: ValidationResult) -> str:
@@ -236,7 +279,7 @@ class ValidationReporter:
             Concise text summary for the agent
         """
         badge = ValidationReporter.generate_status_badge(result)
-        tier_name = result.tier_used.value.replace("_", " ").title()
+        tier_name = _TIER_TITLES[result.tier_used]
 
         text = f"{badge}\n\n"
         text += f"**Validation Tier:** {tier_name}\n"
@@ -253,14 +296,14 @@ class ValidationReporter:
             # Add specific failure info based on tier
             if result.test_result and result.test_result.failures:
                 text += "**Failed Tests:**\n"
-                for failure in result.test_result.failures[:5]:
+                for failure in islice(result.test_result.failures, 5):
                     text += f"- {failure.test_name}: {failure.error_message}\n"
                 if len(result.test_result.failures) > 5:
                     text += f"  ... and {len(result.test_result.failures) - 5} more\n"
 
             elif result.syntax_result and result.syntax_result.errors:
                 text += "**Syntax Errors:**\n"
-                for error in result.syntax_result.errors[:5]:
+                for error in islice(result.syntax_result.errors, 5):
                     loc = f"{error.file_path}"
                     if error.line_number:
                         loc += f":{error.line_number}"
@@ -272,7 +315,7 @@ class ValidationReporter:
 
             elif result.analysis_result and result.analysis_result.issues:
                 text += "**Static Analysis Issues:**\n"
-                for issue in result.analysis_result.issues[:5]:
+                for issue in islice(result.analysis_result.issues, 5):
                     loc = f"{issue.file_path}"
                     if issue.line_number:
                         loc += f":{issue.line_number}"
@@ -285,7 +328,7 @@ class ValidationReporter:
 
             elif result.lint_result and result.lint_result.issues:
                 text += "**Linting Issues:**\n"
-                for issue in result.lint_result.issues[:5]:
+                for issue in islice(result.lint_result.issues, 5):
                     loc = f"{issue.file_path}"
                     if issue.line_number:
                         loc += f":{issue.line_number}"
@@ -311,7 +354,7 @@ class ValidationReporter:
             One-line summary
         """
         badge = ValidationReporter.generate_status_badge(result)
-        tier_name = result.tier_used.value.replace("_", " ").title()
+        tier_name = _TIER_TITLES[result.tier_used]
 
         if result.passed:
             return f"{badge} ({tier_name})"
@@ -5,20 +5,24 @@ Defines data structures for test results, static analysis, linting, and unified
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, NamedTuple, TYPE_CHECKING
 from enum import Enum
 from .detector import ValidationTier
 
+if TYPE_CHECKING:
+    # dependency_validator imports this module
+    from .dependency_validator import DependencyResult
 
-class ValidationStatus(Enum):
-    """Status of validation"""
+
+class ValidationStatus(str, Enum):
+    """Status of validation (str-valued, so results serialize without a hook)"""
     PASSED = "passed"
     FAILED = "failed"
     SKIPPED = "skipped"
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestFailure:
     """Information about a test failure"""
     test_name: str
@@ -28,7 +32,7 @@ class TestFailure:
     traceback: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of test execution"""
     status: ValidationStatus
@@ -47,7 +51,7 @@ class TestResult:
         return self.status == ValidationStatus.PASSED and self.failed_tests == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisIssue:
     """Issue found during static analysis"""
     severity: str  # error, warning, info
@@ -58,7 +62,7 @@ class AnalysisIssue:
     code: Optional[str] = None  # Error code (e.g., "E501" for flake8)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of static analysis (type checking, etc.)"""
     status: ValidationStatus
@@ -76,9 +80,8 @@ class AnalysisResult:
         return self.status == ValidationStatus.PASSED and self.errors == 0
 
 
-@dataclass
-class LintIssue:
-    """Issue found during linting"""
+class LintIssue(NamedTuple):
+    """Issue found during linting (a tuple; parsers build thousands of these)"""
     severity: str  # error, warning, convention, refactor
     message: str
     file_path: str
@@ -87,7 +90,7 @@ class LintIssue:
     rule: Optional[str] = None  # Rule name (e.g., "no-unused-vars")
 
 
-@dataclass
+@dataclass(slots=True)
 class LintResult:
     """Result of linting"""
     status: ValidationStatus
@@ -106,7 +109,7 @@ class LintResult:
         return self.status == ValidationStatus.PASSED and self.errors == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SyntaxError:
     """Syntax error in a file"""
     file_path: str
@@ -115,7 +118,7 @@ class SyntaxError:
     column: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SyntaxResult:
     """Result of syntax checking"""
     status: ValidationStatus
@@ -131,7 +134,7 @@ class SyntaxResult:
         return self.status == ValidationStatus.PASSED and self.total_errors == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Unified validation result combining all validation tiers"""
 
@@ -145,6 +148,9 @@ class ValidationResult:
     lint_result: Optional[LintResult] = None
     syntax_result: Optional[SyntaxResult] = None
 
+    # Supplementary dependency check; rendered by the reporter when it failed
+    dep_result: Optional["DependencyResult"] = None
+
     # Summary
     summary: str = ""
     details: str = ""
@@ -159,18 +165,13 @@ class ValidationResult:
     @property
     def passed(self) -> bool:
         """Check if validation passed overall"""
-        if self.status == ValidationStatus.PASSED:
-            # Check the result that was actually used
-            if self.test_result:
-                return self.test_result.passed
-            elif self.analysis_result:
-                return self.analysis_result.passed
-            elif self.lint_result:
-                return self.lint_result.passed
-            elif self.syntax_result:
-                return self.syntax_result.passed
-            return True
-        return False
+        if self.status != ValidationStatus.PASSED:
+            return False
+
+        # Check the result that was actually used (not cached: the
+        # orchestrator fills in and adjusts results after construction)
+        tier_result = self.test_result or self.analysis_result or self.lint_result or self.syntax_result
+        return tier_result is None or tier_result.passed
 
     @property
     def has_failures(self) -> bool:
@@ -4,15 +4,136 @@ Test runner for executing tests across multiple test frameworks.
 Supports pytest, unittest, jest, mocha, vitest, go test, cargo test, rspec, and junit.
 """
 
-import subprocess
+import asyncio
+import hashlib
 import json
+import os
 import re
 import time
+from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 from .result_types import TestResult, TestFailure, ValidationStatus
-from .detector import TestDetectionResult
+from .detector import TestDetectionResult, _IGNORE_DIRS, _IGNORE_SUFFIXES
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: str):
+    """Decode test framework JSON; orjson is several times faster on large reports."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Summary counts shared by pytest and jest/mocha/vitest output, one group per count
+_SUMMARY_COUNTS_RE = re.compile(
+    r'(?P<passed>\d+)\s+passed|(?P<failed>\d+)\s+failed|(?P<skipped>\d+)\s+skipped'
+)
+
+# pytest: FAILED test_file.py::test_name - Error message
+# Scanned over the whole output, so no part of the pattern may cross a newline
+_PYTEST_FAILURE_RE = re.compile(r'FAILED[^\S\n]+([^:\n]+)::(\S+)[^\S\n]*-?[^\S\n]*(.+)?')
+
+# go test: --- PASS/FAIL: TestName
+_GO_PASS_RE = re.compile(r'---\s*PASS:')
+_GO_FAIL_RE = re.compile(r'---\s*FAIL:')
+_GO_FAIL_NAME_RE = re.compile(r'FAIL:\s+(\S+)')
+
+# cargo: "test result: ok. X passed; Y failed; Z ignored"
+_CARGO_RESULT_RE = re.compile(r'test result:.+?(\d+)\s+passed;\s+(\d+)\s+failed')
+
+# rspec: "X examples, Y failures"
+_RSPEC_EXAMPLES_RE = re.compile(r'(\d+)\s+examples?')
+_RSPEC_FAILURES_RE = re.compile(r'(\d+)\s+failures?')
+
+# Cached test results kept per repository (least recently used are evicted)
+TEST_CACHE_SIZE = 32
+
+# Unknown frameworks: anything that looks like a test count
+_GENERIC_COUNTS_RE = re.compile(
+    r'(?P<passed>\d+)\s+(?:passed|ok|success)|(?P<failed>\d+)\s+(?:failed|error|failure)',
+    re.IGNORECASE
+)
+
+# Summary lines are printed last, so counts are only searched for in this
+# many trailing characters of stdout
+SUMMARY_TAIL_SIZE = 4096
+
+# Dirty files under these directories don't change the cache key: tarsis'
+# own state (test/lint caches, reflections), tool caches, and dependency or
+# build trees that can hold many thousands of files
+_CACHE_KEY_IGNORE_DIRS = _IGNORE_DIRS | {
+    ".tarsis", ".mypy_cache", ".ruff_cache", ".tox", ".nox", ".cache"
+}
+
+# fail_fast: stop the test process once this many failures have streamed by
+FAIL_FAST_FAILURES = 5
+
+# fail_fast reads stdout in chunks of this size and splits lines itself, so
+# no single line is subject to the stream reader's length limit
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Per-test failure lines as they stream from stdout, capturing the test name
+_FAIL_FAST_MARKERS = {
+    "pytest": re.compile(rb'^(\S+::\S+) FAILED'),  # -v progress line
+    "go_test": re.compile(rb'"Action":"fail".*?"Test":"([^"]+)"'),  # -json event
+    "cargo_test": re.compile(rb'^test (\S+) \.\.\. FAILED'),
+    "rspec": re.compile(rb'^\s*(.+?) \(FAILED - \d+\)'),  # documentation format
+}
+
+# Test file naming around the module name: test_foo, foo_test, foo.test, foo_spec, ...
+_TEST_STEM_RE = re.compile(r'^tests?_|(?:[._](?:tests?|spec))$')
+
+
+def _summary_counts(pattern: re.Pattern, stdout: str) -> Dict[str, int]:
+    """
+    Collect the first value of each named count group near the end of stdout.
+
+    Args:
+        pattern: Compiled pattern with one named group per count
+        stdout: Test command output
+
+    Returns:
+        Dict of group name to count, for groups that matched
+    """
+    # Start at a line boundary so a count is never cut in half
+    pos = stdout.rfind('\n', 0, max(0, len(stdout) - SUMMARY_TAIL_SIZE)) + 1
+
+    counts: Dict[str, int] = {}
+    for match in pattern.finditer(stdout, pos):
+        name = match.lastgroup
+        if name not in counts:
+            counts[name] = int(match.group(name))
+            if len(counts) == pattern.groups:
+                break
+    return counts
+
+
+@lru_cache(maxsize=8)
+def _related_test_index(test_files: tuple) -> tuple:
+    """
+    Index test files by the module name they cover and by directory.
+
+    Args:
+        test_files: Test file paths from detection
+
+    Returns:
+        (stem_index, dir_index) dicts mapping a name to test files
+    """
+    stem_index: Dict[str, List[str]] = {}
+    dir_index: Dict[str, List[str]] = {}
+    for test_file in test_files:
+        path = Path(test_file)
+        stem_index.setdefault(_TEST_STEM_RE.sub('', path.stem), []).append(test_file)
+        for directory in path.parent.parts:
+            dir_index.setdefault(directory, []).append(test_file)
+    return stem_index, dir_index
 
 
 class TestRunner:
@@ -22,19 +143,30 @@ class TestRunner:
     Supports multiple test frameworks across different languages.
     """
 
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, cache_dir: Optional[str] = ".tarsis/test-cache"):
         """
         Initialize test runner.
 
         Args:
             repo_path: Path to repository root
+            cache_dir: Directory for cached test results (None disables caching)
         """
         self.repo_path = Path(repo_path)
 
+        # One cache directory per repository, like the linter's cache
+        self.cache_dir = None
+        if cache_dir:
+            repo_key = hashlib.blake2b(
+                str(self.repo_path.resolve()).encode(),
+                digest_size=8
+            ).hexdigest()
+            self.cache_dir = Path(cache_dir).resolve() / repo_key
+
     async def run_tests(
         self,
         detection_result: TestDetectionResult,
-        modified_files: Optional[List[str]] = None
+        modified_files: Optional[List[str]] = None,
+        fail_fast: bool = False
     ) -> TestResult:
         """
         Run tests using detected framework.
@@ -42,6 +174,8 @@ class TestRunner:
         Args:
             detection_result: Test framework detection results
             modified_files: Optional list of modified files for targeted testing
+            fail_fast: Stop the run after FAIL_FAST_FAILURES failures, returning
+                a partial FAILED result (frameworks with streamable output only)
 
         Returns:
             TestResult with test execution outcomes
@@ -61,35 +195,87 @@ class TestRunner:
                 modified_files
             )
 
-            # Execute tests
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-                cwd=str(self.repo_path),
-                shell=False
+            # Unchanged tree and command: reuse the previous result
+            cache_key = None
+            if self.cache_dir:
+                cache_key = await self._cache_key(
+                    detection_result.framework, modified_files, command
+                )
+                cached_result = self._load_cached_result(cache_key) if cache_key else None
+                if cached_result is not None:
+                    return cached_result
+
+            # Execute tests without blocking the event loop; output is
+            # captured as bytes and decoded once below
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.repo_path)
             )
 
+            failure_marker = _FAIL_FAST_MARKERS.get(detection_result.framework) if fail_fast else None
+            streamed_failures: List[str] = []
+            try:
+                if failure_marker is None:
+                    stdout, stderr = await asyncio.wait_for(
+                        process.communicate(),
+                        timeout=300  # 5 minute timeout
+                    )
+                else:
+                    stdout, stderr = await asyncio.wait_for(
+                        self._read_until_failures(process, failure_marker, streamed_failures),
+                        timeout=300
+                    )
+            except asyncio.TimeoutError:
+                return TestResult(
+                    status=ValidationStatus.ERROR,
+                    error_message="Test execution timed out (5 minutes)",
+                    duration=time.time() - start_time
+                )
+            finally:
+                # Timed out, cancelled or failed reading: don't leave the test
+                # process running, and reap it even if cancelled again
+                if process.returncode is None:
+                    process.kill()
+                    await asyncio.shield(process.wait())
+
             duration = time.time() - start_time
 
             # Parse output based on framework
             test_result = self._parse_test_output(
                 detection_result.framework,
-                result.stdout,
-                result.stderr,
-                result.returncode,
+                stdout.decode("utf-8", errors="replace"),
+                stderr.decode("utf-8", errors="replace"),
+                process.returncode,
                 duration
             )
 
+            if len(streamed_failures) >= FAIL_FAST_FAILURES:
+                # Killed mid-run: the summary is missing, so count what streamed by
+                test_result.status = ValidationStatus.FAILED
+                test_result.failed_tests = max(test_result.failed_tests, len(streamed_failures))
+                test_result.total_tests = max(
+                    test_result.total_tests,
+                    test_result.passed_tests + test_result.failed_tests + test_result.skipped_tests
+                )
+                if not test_result.failures:
+                    test_result.failures = [
+                        TestFailure(test_name=name, error_message="Test failed")
+                        for name in streamed_failures
+                    ]
+                test_result.error_message = (
+                    f"Stopped after {len(streamed_failures)} failures (fail_fast)"
+                )
+
+            # Only passes are cached: errors may be transient (missing tool,
+            # flaky environment), a failure may be a flaky test that should
+            # get another run, and fail_fast results are partial
+            elif cache_key and test_result.status == ValidationStatus.PASSED:
+                self._save_cached_result(cache_key, test_result)
+
             return test_result
 
-        except subprocess.TimeoutExpired:
-            return TestResult(
-                status=ValidationStatus.ERROR,
-                error_message="Test execution timed out (5 minutes)",
-                duration=time.time() - start_time
-            )
         except Exception as e:
             return TestResult(
                 status=ValidationStatus.ERROR,
@@ -98,6 +284,162 @@ class TestRunner:
                 output=str(e)
             )
 
+    async def _read_until_failures(
+        self,
+        process: asyncio.subprocess.Process,
+        failure_marker: re.Pattern,
+        failures: List[str]
+    ) -> tuple:
+        """
+        Read test output as it streams, killing the process once enough tests fail.
+
+        Args:
+            process: Running test process
+            failure_marker: Bytes pattern matching a failure line (group 1 is the test name)
+            failures: Receives the names of failed tests as they stream by
+
+        Returns:
+            (stdout, stderr) bytes, as from process.communicate()
+        """
+        # Drain stderr concurrently so a full pipe can't stall the test process
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            chunks = []
+            pending = bytearray()  # Output after the last complete line
+            while len(failures) < FAIL_FAST_FAILURES:
+                chunk = await process.stdout.read(STREAM_CHUNK_SIZE)
+                if chunk:
+                    chunks.append(chunk)
+                    pending += chunk
+                    end = pending.rfind(b"\n") + 1
+                    lines = bytes(pending[:end]).splitlines()
+                    del pending[:end]
+                else:
+                    # End of output: the last line may lack a newline
+                    lines = [bytes(pending)]
+
+                for line in lines:
+                    match = failure_marker.search(line)
+                    if match:
+                        failures.append(match.group(1).decode("utf-8", errors="replace"))
+                        if len(failures) >= FAIL_FAST_FAILURES:
+                            process.kill()
+                            break
+
+                if not chunk:
+                    break
+
+            stderr = await stderr_task
+            await process.wait()
+            return b"".join(chunks), stderr
+        finally:
+            stderr_task.cancel()
+
+    async def _cache_key(
+        self,
+        framework: str,
+        modified_files: Optional[List[str]],
+        command: List[str]
+    ) -> Optional[str]:
+        """
+        Compute the result cache key for a test run.
+
+        The key covers the framework, modified files and command, plus the
+        git HEAD and the size and mtime of every uncommitted or untracked
+        file outside tool, cache and dependency directories.
+
+        Args:
+            framework: Test framework name
+            modified_files: Modified files passed to run_tests
+            command: Test command that would be executed
+
+        Returns:
+            Hex digest, or None if the tree state can't be determined (not a git repo)
+        """
+        head = await self._git_output("rev-parse", "HEAD")
+        status = await self._git_output("status", "--porcelain", "-z", "--untracked-files=all")
+        if head is None or status is None:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((framework, tuple(sorted(modified_files or ())), tuple(command))).encode())
+        digest.update(head)
+
+        # Our own cache may live inside the repository under any name
+        try:
+            cache_prefix = self.cache_dir.relative_to(self.repo_path.resolve()).parts[0]
+        except ValueError:
+            cache_prefix = None
+
+        # Hash each dirty entry with its size and mtime; status alone can't
+        # tell two edits of the same file apart, and stat data can without
+        # reading (possibly huge) files
+        entries = iter(status.split(b"\0"))
+        for entry in entries:
+            if not entry:
+                continue
+            if entry[:1] in (b"R", b"C"):
+                next(entries, None)  # Skip the rename/copy source path
+            rel_path = os.fsdecode(entry[3:])
+            dir_names = rel_path.split("/")[:-1]
+            if cache_prefix in dir_names[:1] or any(
+                name in _CACHE_KEY_IGNORE_DIRS or name.endswith(_IGNORE_SUFFIXES)
+                for name in dir_names
+            ):
+                continue
+            digest.update(entry)
+            try:
+                stat = os.stat(self.repo_path / rel_path)
+                digest.update(f"\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+            except OSError:
+                pass  # Deleted
+
+        return digest.hexdigest()
+
+    async def _git_output(self, *args: str) -> Optional[bytes]:
+        """Run a git command in the repository, returning stdout or None on failure"""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "git", *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=str(self.repo_path)
+            )
+            stdout, _ = await process.communicate()
+        except OSError:
+            return None
+
+        return stdout if process.returncode == 0 else None
+
+    def _load_cached_result(self, cache_key: str) -> Optional[TestResult]:
+        """Load a cached test result, marking it most recently used"""
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(cache_file)  # LRU order is tracked by mtime
+        except (OSError, ValueError):
+            return None
+
+        data["status"] = ValidationStatus(data["status"])
+        data["failures"] = [TestFailure(**failure) for failure in data["failures"]]
+        return TestResult(**data)
+
+    def _save_cached_result(self, cache_key: str, test_result: TestResult):
+        """Write a test result to the cache, evicting the least recently used"""
+        data = asdict(test_result)  # ValidationStatus is a str, so json writes its value
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / f"{cache_key}.json", "w", encoding="utf-8") as f:
+                json.dump(data, f)
+
+            entries = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime_ns)
+            for stale in entries[:-TEST_CACHE_SIZE]:
+                stale.unlink()
+        except OSError:
+            pass  # Caching is best-effort
+
     def _build_test_command(
         self,
         detection_result: TestDetectionResult,
@@ -136,9 +478,12 @@ class TestRunner:
                     command.extend(test_files)
 
         elif framework == "jest":
-            # Use JSON output if possible
-            if "--json" not in command and "--verbose" not in command:
-                command.append("--verbose")
+            # npm only forwards flags to the test script after "--"
+            if command[0] == "npm" and "--" not in command:
+                command.append("--")
+            # Structured report on stdout (the text report goes to stderr)
+            if "--json" not in command:
+                command.append("--json")
             # Targeted testing
             if modified_files:
                 # Jest can find related tests automatically
@@ -146,9 +491,9 @@ class TestRunner:
                 command.extend(modified_files)
 
         elif framework == "go_test":
-            # Add verbose flag
-            if "-v" not in command:
-                command.append("-v")
+            # Stream structured events instead of verbose text
+            if "-json" not in command:
+                command.append("-json")
 
         elif framework == "cargo_test":
             # Cargo test is already verbose by default
@@ -182,55 +527,23 @@ class TestRunner:
         Returns:
             Parsed TestResult
         """
-        output = stdout + "\n" + stderr
-
-        # Try JSON parsing first (for supported frameworks)
-        if framework in ("jest", "go_test") and "{" in output:
-            json_result = self._try_parse_json_output(framework, output)
-            if json_result:
-                json_result.duration = duration
-                json_result.output = output
-                return json_result
-
-        # Framework-specific parsers
-        if framework in ("pytest", "unittest"):
-            return self._parse_pytest_output(stdout, stderr, return_code, duration)
-        elif framework in ("jest", "mocha", "vitest"):
-            return self._parse_jest_output(stdout, stderr, return_code, duration)
-        elif framework == "go_test":
-            return self._parse_go_test_output(stdout, stderr, return_code, duration)
-        elif framework == "cargo_test":
-            return self._parse_cargo_output(stdout, stderr, return_code, duration)
-        elif framework == "rspec":
-            return self._parse_rspec_output(stdout, stderr, return_code, duration)
-        else:
-            # Generic parser
-            return self._parse_generic_output(stdout, stderr, return_code, duration)
-
-    def _try_parse_json_output(self, framework: str, output: str) -> Optional[TestResult]:
-        """Try to parse JSON output from test frameworks that support it"""
-        try:
-            # Find JSON in output (it might be mixed with other text)
-            json_start = output.find('{')
-            if json_start == -1:
-                return None
-
-            json_data = json.loads(output[json_start:])
-
-            if framework == "go_test" and "Action" in json_data:
-                # Go test JSON format
-                # This is line-delimited JSON, need different parsing
-                return None  # Fall back to text parsing
+        # Nothing to scan: every parser would find no counts and no failures
+        if not stdout and not stderr:
+            return TestResult(
+                status=ValidationStatus.PASSED if return_code == 0 else ValidationStatus.FAILED,
+                duration=duration
+            )
 
-            return None  # Not a complete JSON format we recognize
+        # Combined once here; the framework parsers scan stdout and store this
+        output = stdout + "\n" + stderr
 
-        except (json.JSONDecodeError, KeyError):
-            return None
+        parser = self._PARSERS.get(framework, TestRunner._parse_generic_output)
+        return parser(self, stdout, output, return_code, duration)
 
     def _parse_pytest_output(
         self,
         stdout: str,
-        stderr: str,
+        output: str,
         return_code: int,
         duration: float
     ) -> TestResult:
@@ -241,14 +554,11 @@ class TestRunner:
         # "====== X passed, Y failed in Z.ZZs ======" (some failed, alternate order)
         # "====== X passed, Y failed, Z skipped in Z.ZZs ======" (with skipped)
 
-        # Extract all components separately
-        passed_match = re.search(r'(\d+)\s+passed', stdout)
-        failed_match = re.search(r'(\d+)\s+failed', stdout)
-        skipped_match = re.search(r'(\d+)\s+skipped', stdout)
-
-        passed = int(passed_match.group(1)) if passed_match else 0
-        failed = int(failed_match.group(1)) if failed_match else 0
-        skipped = int(skipped_match.group(1)) if skipped_match else 0
+        # One scan of the summary for all three components
+        counts = _summary_counts(_SUMMARY_COUNTS_RE, stdout)
+        passed = counts.get("passed", 0)
+        failed = counts.get("failed", 0)
+        skipped = counts.get("skipped", 0)
 
         total = passed + failed + skipped
 
@@ -271,47 +581,128 @@ class TestRunner:
             skipped_tests=skipped,
             duration=duration,
             failures=failures,
-            output=stdout + "\n" + stderr
+            output=output
         )
 
     def _parse_pytest_failures(self, output: str) -> List[TestFailure]:
         """Parse pytest failure details"""
-        failures = []
+        # One scan of the whole buffer instead of splitting it into lines
+        return [
+            TestFailure(
+                test_name=f"{match.group(1)}::{match.group(2)}",
+                error_message=(match.group(3) or "Test failed").strip(),
+                file_path=match.group(1)
+            )
+            for match in _PYTEST_FAILURE_RE.finditer(output)
+        ]
 
-        # Pattern: FAILED test_file.py::test_name - Error message
-        failure_pattern = r'FAILED\s+([^:]+)::([^\s]+)\s*-?\s*(.+)?'
+    def _parse_jest_cli_output(
+        self,
+        stdout: str,
+        output: str,
+        return_code: int,
+        duration: float
+    ) -> TestResult:
+        """Parse jest output, preferring the --json report over text"""
+        jest_result = self._parse_jest_json_output(stdout, output, return_code, duration)
+        if jest_result is not None:
+            return jest_result
+        return self._parse_jest_output(stdout, output, return_code, duration)
 
-        for line in output.split('\n'):
-            match = re.search(failure_pattern, line)
-            if match:
-                file_path = match.group(1)
-                test_name = match.group(2)
-                error_msg = match.group(3) if match.group(3) else "Test failed"
+    def _parse_jest_json_output(
+        self,
+        stdout: str,
+        output: str,
+        return_code: int,
+        duration: float
+    ) -> Optional[TestResult]:
+        """Parse a jest --json report, or return None if stdout has none"""
+        # npm prints its "> pkg test" banner before the report
+        if stdout.startswith('{'):
+            json_start = 0
+        else:
+            json_start = stdout.find('\n{') + 1
+            if json_start == 0:
+                return None
+        try:
+            report = _json_loads(stdout[json_start:])
+            suites = report["testResults"]
+        except (ValueError, KeyError, TypeError):
+            return None
 
+        failures = []
+        for suite in suites:
+            suite_path = suite.get("name", "")
+            try:
+                suite_path = str(Path(suite_path).relative_to(self.repo_path))
+            except ValueError:
+                pass  # Already relative, or outside the repository
+
+            failed_assertions = False
+            for assertion in suite.get("assertionResults", ()):
+                if assertion.get("status") != "failed":
+                    continue
+                failed_assertions = True
+                messages = "\n".join(assertion.get("failureMessages") or ())
+                location = assertion.get("location") or {}
                 failures.append(TestFailure(
-                    test_name=f"{file_path}::{test_name}",
-                    error_message=error_msg.strip(),
-                    file_path=file_path
+                    test_name=assertion.get("fullName") or assertion.get("title", ""),
+                    error_message=messages.strip().partition("\n")[0] or "Test failed",
+                    file_path=suite_path,
+                    line_number=location.get("line"),
+                    traceback=messages or None
                 ))
 
-        return failures
+            # A suite that failed to run (e.g. a syntax error) has no assertions
+            if suite.get("status") == "failed" and not failed_assertions:
+                message = (suite.get("message") or "").strip()
+                # Skip jest's "● Test suite failed to run" heading
+                first_line = next(
+                    (line for line in map(str.strip, message.splitlines())
+                     if line and not line.startswith('●')),
+                    "Test suite failed to run"
+                )
+                failures.append(TestFailure(
+                    test_name=suite_path,
+                    error_message=first_line,
+                    file_path=suite_path,
+                    traceback=message or None
+                ))
+
+        passed = report.get("numPassedTests", 0)
+        failed = report.get("numFailedTests", 0)
+        skipped = report.get("numPendingTests", 0) + report.get("numTodoTests", 0)
+
+        status = (
+            ValidationStatus.PASSED
+            if return_code == 0 and failed == 0 and not failures
+            else ValidationStatus.FAILED
+        )
+
+        return TestResult(
+            status=status,
+            total_tests=report.get("numTotalTests", passed + failed + skipped),
+            passed_tests=passed,
+            failed_tests=failed,
+            skipped_tests=skipped,
+            duration=duration,
+            failures=failures,
+            output=output
+        )
 
     def _parse_jest_output(
         self,
         stdout: str,
-        stderr: str,
+        output: str,
         return_code: int,
         duration: float
     ) -> TestResult:
         """Parse jest/mocha/vitest output"""
         # Jest summary: "Tests:       X failed, Y passed, Z total"
-        passed_match = re.search(r'(\d+)\s+passed', stdout)
-        failed_match = re.search(r'(\d+)\s+failed', stdout)
-        skipped_match = re.search(r'(\d+)\s+skipped', stdout)
-
-        passed = int(passed_match.group(1)) if passed_match else 0
-        failed = int(failed_match.group(1)) if failed_match else 0
-        skipped = int(skipped_match.group(1)) if skipped_match else 0
+        counts = _summary_counts(_SUMMARY_COUNTS_RE, stdout)
+        passed = counts.get("passed", 0)
+        failed = counts.get("failed", 0)
+        skipped = counts.get("skipped", 0)
         total = passed + failed + skipped
 
         # Parse failures
@@ -327,7 +718,7 @@ class TestRunner:
             skipped_tests=skipped,
             duration=duration,
             failures=failures,
-            output=stdout + "\n" + stderr
+            output=output
         )
 
     def _parse_jest_failures(self, output: str) -> List[TestFailure]:
@@ -366,14 +757,14 @@ class TestRunner:
     def _parse_go_test_output(
         self,
         stdout: str,
-        stderr: str,
+        output: str,
         return_code: int,
         duration: float
     ) -> TestResult:
         """Parse go test output"""
         # Go test output: --- PASS/FAIL: TestName
-        passed = len(re.findall(r'---\s*PASS:', stdout))
-        failed = len(re.findall(r'---\s*FAIL:', stdout))
+        passed = len(_GO_PASS_RE.findall(stdout))
+        failed = len(_GO_FAIL_RE.findall(stdout))
         total = passed + failed
 
         # Parse failures
@@ -388,7 +779,86 @@ class TestRunner:
             failed_tests=failed,
             duration=duration,
             failures=failures,
-            output=stdout + "\n" + stderr
+            output=output
+        )
+
+    def _parse_go_output(
+        self,
+        stdout: str,
+        output: str,
+        return_code: int,
+        duration: float
+    ) -> TestResult:
+        """Parse go test output, preferring -json events over verbose text"""
+        go_result = self._parse_go_json_output(stdout, output, return_code, duration)
+        if go_result is not None:
+            return go_result
+        return self._parse_go_test_output(stdout, output, return_code, duration)
+
+    def _parse_go_json_output(
+        self,
+        stdout: str,
+        output: str,
+        return_code: int,
+        duration: float
+    ) -> Optional[TestResult]:
+        """Parse go test -json events, or return None if stdout has none"""
+        passed = failed = skipped = 0
+        failed_tests = []
+        test_output: Dict[tuple, List[str]] = {}
+        seen_event = False
+
+        for line in stdout.splitlines():
+            # Build errors and other non-event lines are interleaved
+            if not line.startswith('{'):
+                continue
+            try:
+                event = _json_loads(line)
+            except ValueError:  # json and orjson decode errors are ValueErrors
+                continue
+            seen_event = True
+
+            test = event.get("Test")
+            if not test:
+                continue  # Package-level event
+
+            action = event.get("Action")
+            key = (event.get("Package", ""), test)
+            if action == "output":
+                text = event.get("Output", "").strip()
+                # Skip the "=== RUN" / "--- FAIL" framing go adds around output
+                if text and not text.startswith(("=== ", "--- ")):
+                    test_output.setdefault(key, []).append(text)
+            elif action == "pass":
+                passed += 1
+            elif action == "fail":
+                failed += 1
+                failed_tests.append(key)
+            elif action == "skip":
+                skipped += 1
+
+        if not seen_event:
+            return None
+
+        failures = [
+            TestFailure(
+                test_name=key[1],
+                error_message='\n'.join(test_output.get(key, ()))
+            )
+            for key in failed_tests
+        ]
+
+        status = ValidationStatus.PASSED if return_code == 0 and failed == 0 else ValidationStatus.FAILED
+
+        return TestResult(
+            status=status,
+            total_tests=passed + failed + skipped,
+            passed_tests=passed,
+            failed_tests=failed,
+            skipped_tests=skipped,
+            duration=duration,
+            failures=failures,
+            output=output
         )
 
     def _parse_go_failures(self, output: str) -> List[TestFailure]:
@@ -407,7 +877,7 @@ class TestRunner:
                     ))
 
                 # New test
-                match = re.search(r'FAIL:\s+(\S+)', line)
+                match = _GO_FAIL_NAME_RE.search(line)
                 current_test = match.group(1) if match else "Unknown test"
                 error_lines = []
             elif current_test and line.strip():
@@ -424,14 +894,13 @@ class TestRunner:
     def _parse_cargo_output(
         self,
         stdout: str,
-        stderr: str,
+        output: str,
         return_code: int,
         duration: float
     ) -> TestResult:
         """Parse cargo test output"""
         # Cargo: "test result: ok. X passed; Y failed; Z ignored"
-        result_pattern = r'test result:.+?(\d+)\s+passed;\s+(\d+)\s+failed'
-        match = re.search(result_pattern, stdout)
+        match = _CARGO_RESULT_RE.search(stdout)
 
         passed = int(match.group(1)) if match else 0
         failed = int(match.group(2)) if match else 0
@@ -456,20 +925,20 @@ class TestRunner:
             failed_tests=failed,
             duration=duration,
             failures=failures,
-            output=stdout + "\n" + stderr
+            output=output
         )
 
     def _parse_rspec_output(
         self,
         stdout: str,
-        stderr: str,
+        output: str,
         return_code: int,
         duration: float
     ) -> TestResult:
         """Parse rspec output"""
         # RSpec: "X examples, Y failures"
-        examples_match = re.search(r'(\d+)\s+examples?', stdout)
-        failures_match = re.search(r'(\d+)\s+failures?', stdout)
+        examples_match = _RSPEC_EXAMPLES_RE.search(stdout)
+        failures_match = _RSPEC_FAILURES_RE.search(stdout)
 
         total = int(examples_match.group(1)) if examples_match else 0
         failed = int(failures_match.group(1)) if failures_match else 0
@@ -492,23 +961,21 @@ class TestRunner:
             failed_tests=failed,
             duration=duration,
             failures=failures,
-            output=stdout + "\n" + stderr
+            output=output
         )
 
     def _parse_generic_output(
         self,
         stdout: str,
-        stderr: str,
+        output: str,
         return_code: int,
         duration: float
     ) -> TestResult:
         """Generic parser for unknown frameworks"""
         # Try to extract any numbers that look like test counts
-        passed_match = re.search(r'(\d+)\s+(?:passed|ok|success)', stdout, re.IGNORECASE)
-        failed_match = re.search(r'(\d+)\s+(?:failed|error|failure)', stdout, re.IGNORECASE)
-
-        passed = int(passed_match.group(1)) if passed_match else 0
-        failed = int(failed_match.group(1)) if failed_match else 0
+        counts = _summary_counts(_GENERIC_COUNTS_RE, stdout)
+        passed = counts.get("passed", 0)
+        failed = counts.get("failed", 0)
 
         status = ValidationStatus.PASSED if return_code == 0 else ValidationStatus.FAILED
 
@@ -518,7 +985,7 @@ class TestRunner:
             passed_tests=passed,
             failed_tests=failed,
             duration=duration,
-            output=stdout + "\n" + stderr
+            output=output
         )
 
     def _find_related_test_files(
@@ -527,16 +994,33 @@ class TestRunner:
         detection_result: TestDetectionResult
     ) -> List[str]:
         """Find test files related to modified files"""
-        # Simple heuristic: look for test files with similar names
-        test_files = []
+        # Match on module name or a shared directory, via a cached index
+        # instead of substring-testing every test file per modified file
+        stem_index, dir_index = _related_test_index(tuple(detection_result.test_files))
 
+        test_files: Dict[str, None] = {}  # Ordered set
         for modified_file in modified_files:
-            path = Path(modified_file)
-            stem = path.stem
-
-            # Look for test files matching this stem
-            for test_file in detection_result.test_files:
-                if stem in test_file or path.parent.name in test_file:
-                    test_files.append(test_file)
-
-        return test_files
+            # Plain string slicing; a Path per modified file is the slow part here
+            slash = modified_file.rfind('/')
+            base = modified_file[slash + 1:]
+            dot = base.rfind('.')
+            stem = base[:dot] if dot > 0 else base
+            test_files.update(dict.fromkeys(stem_index.get(stem, ())))
+
+            if slash > 0:
+                parent = modified_file[modified_file.rfind('/', 0, slash) + 1:slash]
+                test_files.update(dict.fromkeys(dir_index.get(parent, ())))
+
+        return list(test_files)
+
+    # Parser dispatch table (defined after the methods it references)
+    _PARSERS = {
+        "pytest": _parse_pytest_output,
+        "unittest": _parse_pytest_output,
+        "jest": _parse_jest_cli_output,
+        "mocha": _parse_jest_output,
+        "vitest": _parse_jest_output,
+        "go_test": _parse_go_output,
+        "cargo_test": _parse_cargo_output,
+        "rspec": _parse_rspec_output,
+    }
@@ -4,14 +4,91 @@ Static analyzer for type checking and static analysis.
 Supports mypy, pyright, tsc, flow, and other static analysis tools.
 """
 
-import subprocess
+import asyncio
 import re
 import json
+import hashlib
+import io
+from collections import Counter, OrderedDict
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
+from .detector import is_on_path
 from .result_types import AnalysisResult, AnalysisIssue, ValidationStatus
 
+try:
+    import ijson
+    # ijson's JSONError (and IncompleteJSONError) derive from Exception only
+    _FLOW_JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:  # Optional: stream Flow's error list instead of loading it whole
+    ijson = None
+    _FLOW_JSON_ERRORS = (ValueError,)
+
+
+# Issue patterns are scanned over each output buffer with finditer, one match
+# per line: [^\S\n] stands in for \s so that no part of a match crosses a
+# newline, and surrounding whitespace is skipped as line.strip() used to
+
+# mypy: file:line:col: error: message [code]
+_MYPY_RE = re.compile(
+    r'^[^\S\n]*([^:\n]+):(\d+):(\d+):[^\S\n]*(error|warning|note):[^\S\n]*(.+?)'
+    r'(?:[^\S\n]+\[([^\]\n]+)\])?[^\S\n]*$',
+    re.MULTILINE
+)
+
+# pyright: file:line:col - error/warning: message (rule)
+_PYRIGHT_RE = re.compile(
+    r'^[^\S\n]*([^:\n]+):(\d+):(\d+)[^\S\n]+-[^\S\n]+(error|warning|information):[^\S\n]+(.+?)'
+    r'(?:[^\S\n]+\(([^)\n]+)\))?[^\S\n]*$',
+    re.MULTILINE
+)
+
+# tsc: file(line,col): error TS####: message
+_TSC_RE = re.compile(
+    r'^[^\S\n]*([^(\n]+)\((\d+),(\d+)\):[^\S\n]+(error|warning)[^\S\n]+TS(\d+):[^\S\n]+(.+?)[^\S\n]*$',
+    re.MULTILINE
+)
+
+# Unknown tools: count anything that looks like an error or warning
+_SEVERITY_WORD_RE = re.compile(r'\b(?:(error)|(warning))\b', re.IGNORECASE)
+
+# Parsed results are memoized on a digest of the raw output, so a validation
+# loop re-running an analyzer over unchanged files skips the regex scans.
+# Bounded in entries and in the size of output worth hashing.
+PARSE_CACHE_SIZE = 64
+PARSE_CACHE_MAX_OUTPUT = 8 * 1024 * 1024
+_PARSE_CACHE: "OrderedDict[bytes, AnalysisResult]" = OrderedDict()
+
+# Flow prints a JSON report on stdout; sniff it without stripping a copy
+_JSON_START_RE = re.compile(r'\s*\{')
+
+
+def _scan(pattern: "re.Pattern[str]", stdout: str, stderr: str):
+    """Match pattern over stdout then stderr, without joining the two buffers"""
+    return chain(pattern.finditer(stdout), pattern.finditer(stderr))
+
+
+def _combined_output(stdout: str, stderr: str) -> str:
+    """stdout and stderr joined the way AnalysisResult.output stores them"""
+    return stdout + "\n" + stderr
+
+
+def _flow_errors(report: str):
+    """Yield the entries of a Flow JSON report's "errors" list one at a time"""
+    if ijson is not None:
+        yield from ijson.items(io.BytesIO(report.encode()), "errors.item")
+    else:
+        yield from json.loads(report).get("errors", ())
+
+
+def _severity_counts(issues: List[AnalysisIssue]) -> Tuple[int, int]:
+    """Count errors and warnings in one pass over the issues"""
+    counts = Counter(issue.severity for issue in issues)
+    return counts["error"], counts["warning"]
+
 
 class StaticAnalyzer:
     """
@@ -25,7 +102,13 @@ class StaticAnalyzer:
         "python": [
             {
                 "name": "mypy",
-                "command": ["mypy", "."],
+                # Pin the incremental cache under the repo so repeat runs
+                # only re-check modules whose sources changed; the parser
+                # expects file:line:col locations
+                "command": [
+                    "mypy", "--incremental", "--cache-dir", ".mypy_cache",
+                    "--show-column-numbers", "."
+                ],
                 "config_files": ["mypy.ini", "setup.cfg", "pyproject.toml"],
             },
             {
@@ -44,7 +127,7 @@ class StaticAnalyzer:
         "javascript": [
             {
                 "name": "flow",
-                "command": ["flow", "check"],
+                "command": ["flow", "check", "--json"],
                 "config_files": [".flowconfig"],
             },
         ],
@@ -109,25 +192,19 @@ class StaticAnalyzer:
                         command.remove(".")
                     command.extend(files)
 
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    timeout=180,  # 3 minute timeout
-                    cwd=str(self.repo_path)
-                )
+                return_code, stdout, stderr = await self._run_analyzer(command)
 
                 # Parse output
                 analysis_result = self._parse_analyzer_output(
                     tool_name,
-                    result.stdout,
-                    result.stderr,
-                    result.returncode
+                    stdout,
+                    stderr,
+                    return_code
                 )
 
                 return analysis_result
 
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 return AnalysisResult(
                     status=ValidationStatus.ERROR,
                     tool=tool_name,
@@ -150,17 +227,78 @@ class StaticAnalyzer:
             output=f"No working static analyzer found for {language}"
         )
 
-    def _is_tool_available(self, tool_name: str) -> bool:
-        """Check if tool is available in PATH"""
+    async def run_analysis_multi(
+        self,
+        languages: List[str],
+        files: Optional[List[str]] = None
+    ) -> Dict[str, AnalysisResult]:
+        """
+        Run static analysis for several languages concurrently.
+
+        Each language's analyzer is an independent process, so wall time is
+        that of the slowest language rather than the sum.
+
+        Args:
+            languages: Programming languages to analyze
+            files: Optional list of files to analyze
+
+        Returns:
+            AnalysisResult per language
+        """
+        results = await asyncio.gather(*(
+            self.run_analysis(language, files)
+            for language in languages
+        ))
+        return dict(zip(languages, results))
+
+    async def _run_analyzer(self, command: List[str]) -> Tuple[int, str, str]:
+        """
+        Run an analyzer process without blocking the event loop.
+
+        Args:
+            command: Analyzer command and arguments
+
+        Returns:
+            (return code, stdout, stderr)
+
+        Raises:
+            asyncio.TimeoutError: If the analyzer runs longer than 3 minutes
+            FileNotFoundError: If the analyzer isn't installed
+        """
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.repo_path)
+        )
+
         try:
-            subprocess.run(
-                [tool_name, "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+            # Both pipes are drained concurrently while the analyzer runs
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=180)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        except asyncio.CancelledError:
+            # Superseded (e.g. a higher-priority validation tier finished first)
+            process.kill()
+            # Reap the child so it doesn't linger holding its pipes, even if
+            # this task is cancelled again while waiting
+            await asyncio.shield(process.wait())
+            raise
+
+        return (
+            process.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace")
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _is_tool_available(tool_name: str) -> bool:
+        """Check if tool is available in PATH (cached, no process spawn)"""
+        # Exec failures at run time still fall through to the next analyzer
+        return is_on_path(tool_name)
 
     def _parse_analyzer_output(
         self,
@@ -181,47 +319,65 @@ class StaticAnalyzer:
         Returns:
             Parsed AnalysisResult
         """
-        output = stdout + "\n" + stderr
+        if len(stdout) + len(stderr) > PARSE_CACHE_MAX_OUTPUT:
+            return self._dispatch_parser(tool, stdout, stderr, return_code)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{tool}\0{return_code}\0{len(stdout)}\0".encode())
+        digest.update(stdout.encode())
+        digest.update(stderr.encode())
+        cache_key = digest.digest()
+
+        result = _PARSE_CACHE.get(cache_key)
+        if result is None:
+            result = self._dispatch_parser(tool, stdout, stderr, return_code)
+            _PARSE_CACHE[cache_key] = result
+            if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        else:
+            _PARSE_CACHE.move_to_end(cache_key)
+
+        # Callers get their own issues list, never the cached one
+        return replace(result, issues=list(result.issues))
 
+    def _dispatch_parser(
+        self,
+        tool: str,
+        stdout: str,
+        stderr: str,
+        return_code: int
+    ) -> AnalysisResult:
+        """Run the parser for tool over its output (uncached)"""
+        # Parsers scan stdout and stderr in place; the joined text is only
+        # built once, for AnalysisResult.output
         if tool == "mypy":
-            return self._parse_mypy_output(output, return_code)
+            return self._parse_mypy_output(stdout, stderr, return_code)
         elif tool == "pyright":
-            return self._parse_pyright_output(output, return_code)
+            return self._parse_pyright_output(stdout, stderr, return_code)
         elif tool == "tsc":
-            return self._parse_tsc_output(output, return_code)
+            return self._parse_tsc_output(stdout, stderr, return_code)
         elif tool == "flow":
-            return self._parse_flow_output(output, return_code)
+            return self._parse_flow_output(stdout, stderr, return_code)
         else:
-            return self._parse_generic_output(tool, output, return_code)
+            return self._parse_generic_output(tool, stdout, stderr, return_code)
 
-    def _parse_mypy_output(self, output: str, return_code: int) -> AnalysisResult:
+    def _parse_mypy_output(self, stdout: str, stderr: str, return_code: int) -> AnalysisResult:
         """Parse mypy output"""
-        # mypy format: file:line:col: error: message [code]
-        pattern = r'([^:]+):(\d+):(\d+):\s*(error|warning|note):\s*(.+?)(?:\s+\[([^\]]+)\])?$'
-
-        issues = []
-        for line in output.split('\n'):
-            match = re.match(pattern, line.strip())
-            if match:
-                file_path = match.group(1)
-                line_num = int(match.group(2))
-                col = int(match.group(3))
-                severity = match.group(4)
-                message = match.group(5)
-                code = match.group(6) if match.group(6) else None
-
-                issues.append(AnalysisIssue(
-                    severity=severity,
-                    message=message,
-                    file_path=file_path,
-                    line_number=line_num,
-                    column=col,
-                    code=code
-                ))
+        # One scan of each buffer instead of a match per line
+        issues = [
+            AnalysisIssue(
+                severity=match[4],
+                message=match[5],
+                file_path=match[1],
+                line_number=int(match[2]),
+                column=int(match[3]),
+                code=match[6]
+            )
+            for match in _scan(_MYPY_RE, stdout, stderr)
+        ]
 
         # Count by severity
-        errors = sum(1 for issue in issues if issue.severity == "error")
-        warnings = sum(1 for issue in issues if issue.severity == "warning")
+        errors, warnings = _severity_counts(issues)
 
         # Determine status
         if return_code == 0:
@@ -238,10 +394,10 @@ class StaticAnalyzer:
             total_issues=len(issues),
             errors=errors,
             warnings=warnings,
-            output=output
+            output=_combined_output(stdout, stderr)
         )
 
-    def _parse_pyright_output(self, output: str, return_code: int) -> AnalysisResult:
+    def _parse_pyright_output(self, stdout: str, stderr: str, return_code: int) -> AnalysisResult:
         """Parse pyright output"""
         # Try JSON output first
         try:
@@ -252,23 +408,19 @@ class StaticAnalyzer:
             pass
 
         # Text format: file:line:col - error/warning: message
-        pattern = r'([^:]+):(\d+):(\d+)\s+-\s+(error|warning|information):\s+(.+?)(?:\s+\(([^\)]+)\))?$'
-
-        issues = []
-        for line in output.split('\n'):
-            match = re.match(pattern, line.strip())
-            if match:
-                issues.append(AnalysisIssue(
-                    severity=match.group(4),
-                    message=match.group(5),
-                    file_path=match.group(1),
-                    line_number=int(match.group(2)),
-                    column=int(match.group(3)),
-                    code=match.group(6) if match.group(6) else None
-                ))
-
-        errors = sum(1 for issue in issues if issue.severity == "error")
-        warnings = sum(1 for issue in issues if issue.severity == "warning")
+        issues = [
+            AnalysisIssue(
+                severity=match[4],
+                message=match[5],
+                file_path=match[1],
+                line_number=int(match[2]),
+                column=int(match[3]),
+                code=match[6]
+            )
+            for match in _scan(_PYRIGHT_RE, stdout, stderr)
+        ]
+
+        errors, warnings = _severity_counts(issues)
 
         status = ValidationStatus.PASSED if return_code == 0 and errors == 0 else ValidationStatus.FAILED
 
@@ -279,29 +431,24 @@ class StaticAnalyzer:
             total_issues=len(issues),
             errors=errors,
             warnings=warnings,
-            output=output
+            output=_combined_output(stdout, stderr)
         )
 
-    def _parse_tsc_output(self, output: str, return_code: int) -> AnalysisResult:
+    def _parse_tsc_output(self, stdout: str, stderr: str, return_code: int) -> AnalysisResult:
         """Parse TypeScript compiler output"""
-        # tsc format: file(line,col): error TS####: message
-        pattern = r'([^(]+)\((\d+),(\d+)\):\s+(error|warning)\s+TS(\d+):\s+(.+)$'
-
-        issues = []
-        for line in output.split('\n'):
-            match = re.match(pattern, line.strip())
-            if match:
-                issues.append(AnalysisIssue(
-                    severity=match.group(4),
-                    message=match.group(6),
-                    file_path=match.group(1),
-                    line_number=int(match.group(2)),
-                    column=int(match.group(3)),
-                    code=f"TS{match.group(5)}"
-                ))
-
-        errors = sum(1 for issue in issues if issue.severity == "error")
-        warnings = sum(1 for issue in issues if issue.severity == "warning")
+        issues = [
+            AnalysisIssue(
+                severity=match[4],
+                message=match[6],
+                file_path=match[1],
+                line_number=int(match[2]),
+                column=int(match[3]),
+                code=f"TS{match[5]}"
+            )
+            for match in _scan(_TSC_RE, stdout, stderr)
+        ]
+
+        errors, warnings = _severity_counts(issues)
 
         status = ValidationStatus.PASSED if return_code == 0 and errors == 0 else ValidationStatus.FAILED
 
@@ -312,37 +459,36 @@ class StaticAnalyzer:
             total_issues=len(issues),
             errors=errors,
             warnings=warnings,
-            output=output
+            output=_combined_output(stdout, stderr)
         )
 
-    def _parse_flow_output(self, output: str, return_code: int) -> AnalysisResult:
+    def _parse_flow_output(self, stdout: str, stderr: str, return_code: int) -> AnalysisResult:
         """Parse Flow output"""
-        # Flow can output JSON
+        # Flow is run with --json; errors are streamed one at a time when
+        # ijson is installed, so a huge report never becomes one dict tree
         try:
-            # Try JSON parsing
-            if output.strip().startswith('{'):
-                data = json.loads(output)
-                if "errors" in data:
-                    issues = []
-                    for error in data["errors"]:
+            if _JSON_START_RE.match(stdout):
+                issues = [
+                    AnalysisIssue(
+                        severity="error",
                         # Flow errors are complex nested structures
-                        message = error.get("message", [{}])[0].get("descr", "Error")
-                        issues.append(AnalysisIssue(
-                            severity="error",
-                            message=message,
-                            file_path="unknown"
-                        ))
-
-                    return AnalysisResult(
-                        status=ValidationStatus.FAILED if issues else ValidationStatus.PASSED,
-                        tool="flow",
-                        issues=issues,
-                        total_issues=len(issues),
-                        errors=len(issues),
-                        warnings=0,
-                        output=output
+                        message=(error.get("message") or [{}])[0].get("descr", "Error"),
+                        file_path="unknown"
                     )
-        except json.JSONDecodeError:
+                    for error in _flow_errors(stdout)
+                ]
+
+                return AnalysisResult(
+                    status=ValidationStatus.FAILED if issues else ValidationStatus.PASSED,
+                    tool="flow",
+                    issues=issues,
+                    total_issues=len(issues),
+                    errors=len(issues),
+                    warnings=0,
+                    output=_combined_output(stdout, stderr)
+                )
+        except _FLOW_JSON_ERRORS:
+            # Truncated or malformed report: fall back to the exit code
             pass
 
         # Text parsing fallback
@@ -355,14 +501,17 @@ class StaticAnalyzer:
             total_issues=0,
             errors=0,
             warnings=0,
-            output=output
+            output=_combined_output(stdout, stderr)
         )
 
-    def _parse_generic_output(self, tool: str, output: str, return_code: int) -> AnalysisResult:
+    def _parse_generic_output(self, tool: str, stdout: str, stderr: str, return_code: int) -> AnalysisResult:
         """Generic parser for unknown tools"""
         # Try to find error/warning patterns
-        error_count = len(re.findall(r'\berror\b', output, re.IGNORECASE))
-        warning_count = len(re.findall(r'\bwarning\b', output, re.IGNORECASE))
+        # One scan for both words; lastindex tells which alternative matched
+        counts = [0, 0, 0]
+        for match in _scan(_SEVERITY_WORD_RE, stdout, stderr):
+            counts[match.lastindex] += 1
+        error_count, warning_count = counts[1], counts[2]
 
         status = ValidationStatus.PASSED if return_code == 0 and error_count == 0 else ValidationStatus.FAILED
 
@@ -373,5 +522,5 @@ class StaticAnalyzer:
             total_issues=error_count + warning_count,
             errors=error_count,
             warnings=warning_count,
-            output=output
+            output=_combined_output(stdout, stderr)
         )
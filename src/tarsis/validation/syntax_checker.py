@@ -5,15 +5,49 @@ Provides basic syntax validation as a fallback when no tests or higher-tier
 validation is available.
 """
 
+import asyncio
+import os
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import re
 
 from .result_types import SyntaxResult, SyntaxError as SyntaxErr, ValidationStatus
 
 
+# Location patterns are scanned over the whole output with finditer, so no
+# part of a match may cross a newline
+
+# Python: File "...", line X
+_PY_LOCATION_RE = re.compile(r'File "([^"\n]+)", line (\d+)')
+_PY_MESSAGE_RE = re.compile(r'(SyntaxError|IndentationError|TabError):\s*(.+)')
+
+# Node: file:line:column
+_JS_LOCATION_RE = re.compile(r':(\d+):(\d+)')
+
+# gofmt: file:line:col: message
+_GO_ERROR_RE = re.compile(r'([^:\n]+):(\d+):(\d+):[^\S\n]*(.+)')
+
+# rustc: error: message --> file:line:col
+_RUST_LOCATION_RE = re.compile(r'-->[^\S\n]*([^:\n]+):(\d+):(\d+)')
+
+# Most files _get_all_source_files returns when no file list is given
+MAX_SOURCE_FILES = 100
+
+# Directories (matched by name, at any depth) never searched for files to check
+_EXCLUDE_DIRS = frozenset({
+    ".git", "node_modules", "__pycache__", ".venv", "venv",
+    "dist", "build", "target", ".pytest_cache", "vendor", ".tox"
+})
+_EXCLUDE_DIR_SUFFIXES = (".egg-info",)
+
+# Batched checkers: pattern whose group 1 is the file an output line is about
+_BATCH_PATH_RES = {
+    "go": _GO_ERROR_RE,
+}
+
+
 class SyntaxChecker:
     """
     Checks syntax of code files across multiple programming languages.
@@ -21,12 +55,8 @@ class SyntaxChecker:
     Always available fallback validation (Tier 4).
     """
 
-    # Language-specific syntax checkers
+    # Language-specific syntax checkers (Python is compiled in-process instead)
     SYNTAX_CHECKERS = {
-        "python": {
-            "command": ["python", "-m", "py_compile"],
-            "file_arg": True,  # File path is passed as argument
-        },
         "javascript": {
             "command": ["node", "--check"],
             "file_arg": True,
@@ -37,7 +67,8 @@ class SyntaxChecker:
         },
         "go": {
             "command": ["gofmt", "-e"],
-            "file_arg": True,
+            "file_arg": True,  # File path is passed as argument
+            "batch": True,  # Accepts several files in one invocation
         },
         "rust": {
             "command": ["rustc", "--crate-type", "lib", "-Z", "parse-only"],
@@ -79,9 +110,13 @@ class SyntaxChecker:
             SyntaxResult with syntax check outcomes
         """
         try:
-            # Determine files to check
+            # Determine files to check; the walker only yields files it just
+            # saw on disk, so only caller-supplied paths need an exists() stat
+            check_exists = files is not None
             if files is None:
-                files = self._get_all_source_files(language)
+                # git ls-files or a directory walk: keep both off the event loop
+                loop = asyncio.get_running_loop()
+                files = await loop.run_in_executor(None, self._get_all_source_files, language)
 
             if not files:
                 return SyntaxResult(
@@ -90,14 +125,37 @@ class SyntaxChecker:
                     output="No files to check"
                 )
 
-            # Check each file
-            errors = []
-            files_checked = 0
-
+            # Group by language so batchable checkers run once per language
+            by_language: Dict[Optional[str], List[str]] = {}
             for file_path in files:
-                file_errors = await self._check_file_syntax(file_path, language)
+                file_language = language or self._detect_language(self.repo_path / file_path)
+                by_language.setdefault(file_language, []).append(file_path)
+
+            checks = []
+            for file_language, language_files in by_language.items():
+                checker_config = self.SYNTAX_CHECKERS.get(file_language)
+                if checker_config and checker_config.get("batch") and len(language_files) > 1:
+                    checks.append(
+                        self._check_batch_syntax(language_files, file_language, check_exists)
+                    )
+                else:
+                    checks.extend(
+                        self._check_file_syntax(file_path, file_language, check_exists)
+                        for file_path in language_files
+                    )
+
+            # Run checker processes concurrently, a few per CPU at a time
+            semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+            async def run_check(check) -> List[SyntaxErr]:
+                async with semaphore:
+                    return await check
+
+            errors = []
+            for file_errors in await asyncio.gather(*(run_check(check) for check in checks)):
                 errors.extend(file_errors)
-                files_checked += 1
+
+            files_checked = len(files)
 
             # Determine status
             if errors:
@@ -123,7 +181,8 @@ class SyntaxChecker:
     async def _check_file_syntax(
         self,
         file_path: str,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        check_exists: bool = True
     ) -> List[SyntaxErr]:
         """
         Check syntax of a single file.
@@ -131,13 +190,15 @@ class SyntaxChecker:
         Args:
             file_path: File path relative to repo_path
             language: Optional language hint
+            check_exists: Whether to stat the file first (False when it
+                          came from _get_all_source_files)
 
         Returns:
             List of syntax errors found
         """
         full_path = self.repo_path / file_path
 
-        if not full_path.exists():
+        if check_exists and not full_path.exists():
             return [SyntaxErr(
                 file_path=file_path,
                 message=f"File not found: {file_path}"
@@ -151,6 +212,12 @@ class SyntaxChecker:
             # Unknown language, skip
             return []
 
+        # We are a Python interpreter already: compile in-process rather
+        # than paying for a py_compile subprocess per file
+        if language == "python":
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._compile_python, file_path)
+
         # Get syntax checker for language
         checker_config = self.SYNTAX_CHECKERS.get(language)
         if checker_config is None:
@@ -163,26 +230,20 @@ class SyntaxChecker:
             if checker_config["file_arg"]:
                 command.append(str(full_path))
 
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=str(self.repo_path)
-            )
+            return_code, stdout, stderr = await self._run_checker(command)
 
             # Parse errors from output
-            if result.returncode != 0:
+            if return_code != 0:
                 errors = self._parse_syntax_errors(
                     file_path,
-                    result.stderr or result.stdout,
+                    stderr or stdout,
                     language
                 )
                 return errors
 
             return []
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return [SyntaxErr(
                 file_path=file_path,
                 message="Syntax check timed out"
@@ -197,6 +258,138 @@ class SyntaxChecker:
                 message=f"Error checking syntax: {str(e)}"
             )]
 
+    async def _check_batch_syntax(
+        self,
+        files: List[str],
+        language: str,
+        check_exists: bool = True
+    ) -> List[SyntaxErr]:
+        """
+        Check several files of one language with a single checker process.
+
+        Errors are attributed to files by the paths the checker reports. Files
+        that can't be attributed are checked one at a time instead.
+
+        Args:
+            files: File paths relative to repo_path
+            language: Language of every file
+            check_exists: Whether to stat each file first
+
+        Returns:
+            List of syntax errors found
+        """
+        checker_config = self.SYNTAX_CHECKERS[language]
+        errors = []
+
+        # Full path as passed to (and reported by) the checker -> relative path
+        by_full_path = {}
+        for file_path in files:
+            full_path = self.repo_path / file_path
+            if not check_exists or full_path.exists():
+                by_full_path[str(full_path)] = file_path
+            else:
+                errors.append(SyntaxErr(
+                    file_path=file_path,
+                    message=f"File not found: {file_path}"
+                ))
+
+        if not by_full_path:
+            return errors
+
+        try:
+            return_code, stdout, stderr = await self._run_checker(
+                checker_config["command"] + list(by_full_path)
+            )
+        except (asyncio.TimeoutError, FileNotFoundError):
+            # Per-file checks report timeouts per file and know the fallbacks
+            return_code = None
+
+        chunks = {}
+        if return_code:
+            chunks = self._split_batch_output(stderr or stdout, language, by_full_path)
+
+        if return_code is None or (return_code and not chunks):
+            # Couldn't run the batch, or couldn't tell which file failed
+            for file_path in by_full_path.values():
+                errors.extend(await self._check_file_syntax(file_path, language, False))
+            return errors
+
+        for full_path, chunk in chunks.items():
+            errors.extend(self._parse_syntax_errors(by_full_path[full_path], chunk, language))
+
+        return errors
+
+    async def _run_checker(self, command: List[str]) -> Tuple[int, str, str]:
+        """
+        Run a syntax checker process without blocking the event loop.
+
+        Args:
+            command: Checker command and arguments
+
+        Returns:
+            (return code, stdout, stderr)
+
+        Raises:
+            asyncio.TimeoutError: If the checker runs longer than 30 seconds
+            FileNotFoundError: If the checker isn't installed
+        """
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.repo_path)
+        )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        except asyncio.CancelledError:
+            # Superseded (e.g. a higher-priority validation tier finished first)
+            process.kill()
+            # Reap the child so it doesn't linger holding its pipes, even if
+            # this task is cancelled again while waiting
+            await asyncio.shield(process.wait())
+            raise
+
+        return (
+            process.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace")
+        )
+
+    def _split_batch_output(
+        self,
+        error_output: str,
+        language: str,
+        by_full_path: Dict[str, str]
+    ) -> Dict[str, str]:
+        """
+        Split batched checker output into per-file chunks.
+
+        Args:
+            error_output: Error output from the checker
+            language: Language checked
+            by_full_path: Full paths passed to the checker
+
+        Returns:
+            Output lines per full path; lines without a path belong to the file above
+        """
+        pattern = _BATCH_PATH_RES[language]
+        chunks: Dict[str, List[str]] = {}
+        current = None
+
+        for line in error_output.split('\n'):
+            match = pattern.search(line)
+            if match and match.group(1) in by_full_path:
+                current = match.group(1)
+            if current is not None:
+                chunks.setdefault(current, []).append(line)
+
+        return {full_path: '\n'.join(lines) for full_path, lines in chunks.items()}
+
     async def _try_alternative_checker(
         self,
         file_path: str,
@@ -214,32 +407,42 @@ class SyntaxChecker:
         Returns:
             List of syntax errors
         """
-        full_path = self.repo_path / file_path
-
         # Language-specific alternatives
         if language == "python":
-            # Try to compile with Python
-            try:
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    code = f.read()
-                compile(code, file_path, 'exec')
-                return []
-            except SyntaxError as e:
-                return [SyntaxErr(
-                    file_path=file_path,
-                    line_number=e.lineno,
-                    column=e.offset,
-                    message=str(e.msg)
-                )]
-            except Exception as e:
-                return [SyntaxErr(
-                    file_path=file_path,
-                    message=f"Error: {str(e)}"
-                )]
+            return self._compile_python(file_path)
 
         # For other languages, just skip if checker not available
         return []
 
+    def _compile_python(self, file_path: str) -> List[SyntaxErr]:
+        """
+        Check a Python file's syntax with the built-in compile().
+
+        Args:
+            file_path: File path relative to repo_path
+
+        Returns:
+            List with the first syntax error, or empty if the file compiles
+        """
+        try:
+            # Bytes, so PEP 263 encoding declarations are honoured as by py_compile
+            with open(self.repo_path / file_path, 'rb') as f:
+                code = f.read()
+            compile(code, file_path, 'exec', dont_inherit=True)
+            return []
+        except SyntaxError as e:  # Includes IndentationError and TabError
+            return [SyntaxErr(
+                file_path=file_path,
+                line_number=e.lineno,
+                column=e.offset,
+                message=str(e.msg)
+            )]
+        except Exception as e:
+            return [SyntaxErr(
+                file_path=file_path,
+                message=f"Error: {str(e)}"
+            )]
+
     def _parse_syntax_errors(
         self,
         file_path: str,
@@ -257,74 +460,80 @@ class SyntaxChecker:
         Returns:
             List of parsed syntax errors
         """
+        # Language-specific parsing through the dispatch table
+        parser = self._ERROR_PARSERS.get(language)
+        errors = parser(self, file_path, error_output) if parser else []
+
+        # If no errors parsed but output exists, create generic error
+        if not errors and error_output.strip():
+            errors.append(SyntaxErr(
+                file_path=file_path,
+                message=error_output.strip()[:200]  # Limit message length
+            ))
+
+        return errors
+
+    def _parse_python_errors(self, file_path: str, error_output: str) -> List[SyntaxErr]:
+        """Parse Python tracebacks: File "...", line X"""
+        # The error message (usually on a later line) is the same for every location
+        msg_match = _PY_MESSAGE_RE.search(error_output)
         errors = []
+        for match in _PY_LOCATION_RE.finditer(error_output):
+            if msg_match:
+                message = msg_match.group(2)
+            else:
+                # Fall back to the line holding the location
+                line_start = error_output.rfind('\n', 0, match.start()) + 1
+                line_end = error_output.find('\n', match.end())
+                message = error_output[line_start:line_end if line_end != -1 else None].strip()
 
-        # Language-specific parsing
-        if language == "python":
-            # Python error format: File "...", line X, ...
-            pattern = r'File "([^"]+)", line (\d+)'
-            for line in error_output.split('\n'):
-                match = re.search(pattern, line)
-                if match:
-                    line_num = int(match.group(2))
-                    # Get the error message (usually next line or same line)
-                    msg_match = re.search(r'(SyntaxError|IndentationError|TabError):\s*(.+)', error_output)
-                    message = msg_match.group(2) if msg_match else line.strip()
+            errors.append(SyntaxErr(
+                file_path=file_path,
+                line_number=int(match.group(2)),
+                message=message
+            ))
 
-                    errors.append(SyntaxErr(
-                        file_path=file_path,
-                        line_number=line_num,
-                        message=message
-                    ))
+        return errors
 
-        elif language in ("javascript", "typescript"):
-            # Node error format: file:line:column - error
-            pattern = r':(\d+):(\d+)'
-            for line in error_output.split('\n'):
-                if file_path in line or 'SyntaxError' in line:
-                    match = re.search(pattern, line)
-                    if match:
-                        errors.append(SyntaxErr(
-                            file_path=file_path,
-                            line_number=int(match.group(1)),
-                            column=int(match.group(2)),
-                            message=line.strip()
-                        ))
-
-        elif language == "go":
-            # Go error format: file:line:col: message
-            pattern = r'([^:]+):(\d+):(\d+):\s*(.+)'
-            for line in error_output.split('\n'):
-                match = re.search(pattern, line)
+    def _parse_node_errors(self, file_path: str, error_output: str) -> List[SyntaxErr]:
+        """Parse node --check output: file:line:column - error"""
+        errors = []
+        for line in error_output.split('\n'):
+            if file_path in line or 'SyntaxError' in line:
+                match = _JS_LOCATION_RE.search(line)
                 if match:
                     errors.append(SyntaxErr(
                         file_path=file_path,
-                        line_number=int(match.group(2)),
-                        column=int(match.group(3)),
-                        message=match.group(4)
+                        line_number=int(match.group(1)),
+                        column=int(match.group(2)),
+                        message=line.strip()
                     ))
 
-        elif language == "rust":
-            # Rust error format: error: message --> file:line:col
-            pattern = r'-->\s*([^:]+):(\d+):(\d+)'
-            for line in error_output.split('\n'):
-                match = re.search(pattern, line)
-                if match:
-                    errors.append(SyntaxErr(
-                        file_path=file_path,
-                        line_number=int(match.group(2)),
-                        column=int(match.group(3)),
-                        message="Syntax error"
-                    ))
+        return errors
 
-        # If no errors parsed but output exists, create generic error
-        if not errors and error_output.strip():
-            errors.append(SyntaxErr(
+    def _parse_go_errors(self, file_path: str, error_output: str) -> List[SyntaxErr]:
+        """Parse gofmt output: file:line:col: message"""
+        return [
+            SyntaxErr(
                 file_path=file_path,
-                message=error_output.strip()[:200]  # Limit message length
-            ))
+                line_number=int(match.group(2)),
+                column=int(match.group(3)),
+                message=match.group(4)
+            )
+            for match in _GO_ERROR_RE.finditer(error_output)
+        ]
 
-        return errors
+    def _parse_rust_errors(self, file_path: str, error_output: str) -> List[SyntaxErr]:
+        """Parse rustc output: error: message --> file:line:col"""
+        return [
+            SyntaxErr(
+                file_path=file_path,
+                line_number=int(match.group(2)),
+                column=int(match.group(3)),
+                message="Syntax error"
+            )
+            for match in _RUST_LOCATION_RE.finditer(error_output)
+        ]
 
     def _detect_language(self, file_path: Path) -> Optional[str]:
         """
@@ -364,17 +573,78 @@ class SyntaxChecker:
 
         # Extensions to search for
         if language:
-            exts = self._get_extensions_for_language(language)
+            exts = tuple(self._get_extensions_for_language(language))
         else:
-            exts = [".py", ".js", ".jsx", ".ts", ".tsx", ".go", ".rs", ".rb", ".java"]
+            exts = (".py", ".js", ".jsx", ".ts", ".tsx", ".go", ".rs", ".rb", ".java")
+
+        # In a git checkout, let git list the files: .gitignore'd trees are
+        # never descended into
+        git_files = self._git_source_files(exts)
+        if git_files is not None:
+            return git_files
+
+        # One walk for all extensions rather than an rglob per extension
+        repo_str = str(self.repo_path)
+        for dirpath, dirnames, filenames in os.walk(repo_str):
+            # Prune excluded directories so nothing below them is visited
+            dirnames[:] = [
+                name for name in dirnames
+                if name not in _EXCLUDE_DIRS and not name.endswith(_EXCLUDE_DIR_SUFFIXES)
+            ]
+            for filename in filenames:
+                if filename.endswith(exts):
+                    files.append(os.path.relpath(os.path.join(dirpath, filename), repo_str))
+                    # Stop walking once the cap is reached
+                    if len(files) >= MAX_SOURCE_FILES:
+                        return files
+
+        return files
+
+    def _git_source_files(self, exts: Tuple[str, ...]) -> Optional[List[str]]:
+        """
+        List source files with git (tracked plus untracked, minus ignored).
+
+        Args:
+            exts: File extensions to keep
+
+        Returns:
+            Up to MAX_SOURCE_FILES paths relative to repo_path, or None if
+            repo_path isn't a git checkout (or git isn't installed)
+        """
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                capture_output=True,
+                timeout=30,
+                cwd=str(self.repo_path)
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
 
-        for ext in exts:
-            for file_path in self.repo_path.rglob(f"*{ext}"):
-                if self._should_check_file(file_path):
-                    rel_path = file_path.relative_to(self.repo_path)
-                    files.append(str(rel_path))
+        if result.returncode != 0:
+            return None
 
-        return files[:100]  # Limit to 100 files
+        files = []
+        repo_str = str(self.repo_path)
+        for raw_path in result.stdout.split(b"\0"):
+            file_path = os.fsdecode(raw_path)
+            if not file_path.endswith(exts):
+                continue
+            # Tracked vendored/build trees stay excluded, as in the walk
+            parts = file_path.split("/")
+            if any(
+                part in _EXCLUDE_DIRS or part.endswith(_EXCLUDE_DIR_SUFFIXES)
+                for part in parts[:-1]
+            ):
+                continue
+            # The index still lists tracked files deleted from the work tree
+            if not os.path.isfile(os.path.join(repo_str, file_path)):
+                continue
+            files.append(file_path)
+            if len(files) >= MAX_SOURCE_FILES:
+                break
+
+        return files
 
     def _get_extensions_for_language(self, language: str) -> List[str]:
         """Get file extensions for a language"""
@@ -389,13 +659,11 @@ class SyntaxChecker:
         }
         return lang_to_exts.get(language, [])
 
-    def _should_check_file(self, file_path: Path) -> bool:
-        """Check if file should be checked (exclude build dirs, etc.)"""
-        exclude_patterns = [
-            ".git", "node_modules", "__pycache__", ".venv", "venv",
-            "dist", "build", ".egg-info", "target", ".pytest_cache",
-            "vendor", ".tox"
-        ]
-
-        path_str = str(file_path)
-        return not any(pattern in path_str for pattern in exclude_patterns)
+    # Error parser dispatch table (defined after the methods it references)
+    _ERROR_PARSERS = {
+        "python": _parse_python_errors,
+        "javascript": _parse_node_errors,
+        "typescript": _parse_node_errors,
+        "go": _parse_go_errors,
+        "rust": _parse_rust_errors,
+    }